@@ -5,9 +5,13 @@ from .metrics import (
     HedgeRatioResult,
     compute_adf,
     compute_hedge_ratio,
+    compute_hedge_ratio_batch,
+    compute_pair_analytics,
     compute_rolling_correlation,
     compute_spread,
+    compute_spread_from_aligned,
     compute_zscore,
+    warmup_kernels,
 )
 from .resample import resample_ohlcv, ticks_to_dataframe
 
@@ -16,11 +20,15 @@ __all__ = [
     "HedgeRatioResult",
     "compute_adf",
     "compute_hedge_ratio",
+    "compute_hedge_ratio_batch",
+    "compute_pair_analytics",
     "compute_rolling_correlation",
     "compute_spread",
+    "compute_spread_from_aligned",
     "compute_zscore",
     "resample_ohlcv",
     "ticks_to_dataframe",
+    "warmup_kernels",
 ]
 
 
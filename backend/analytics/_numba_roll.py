@@ -0,0 +1,123 @@
+"""Numba-jitted streaming kernels for the rolling analytics.
+
+The prefix-sum kernels in :mod:`backend.analytics.metrics` already cover the
+series in one scan, but still materialize several full-length intermediate
+arrays. These jitted variants maintain the running sums in scalars — one
+multiply-add per element, no intermediates — which is the streaming form that
+wins on long tick buffers. Semantics match the numpy kernels: global-mean
+centering, expanding head windows (min_periods=2), NaN where a window has
+fewer than two observations or zero variance.
+
+numba is optional; when it is missing the callables are ``None`` and
+``metrics`` falls back to the numpy prefix-sum implementations.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - optional accelerator
+    njit = None
+
+
+# Relative noise floor for the zero-variance clamp: running subtract-on-exit
+# sums accumulate rounding over the whole series, so the tolerance is well
+# above one float64 ulp but far below any real price variance.
+_VAR_RTOL = 1e-9
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def rolling_zscore(values: np.ndarray, window: int) -> np.ndarray:  # pragma: no cover - jitted
+        n = values.size
+        out = np.empty(n, dtype=np.float64)
+        if n == 0:
+            return out
+
+        # Center on the global mean so the running sums stay small relative
+        # to the variance (same cancellation guard as the numpy kernel).
+        mean_all = 0.0
+        for i in range(n):
+            mean_all += values[i]
+        mean_all /= n
+
+        s = 0.0
+        sq = 0.0
+        for i in range(n):
+            x = values[i] - mean_all
+            s += x
+            sq += x * x
+            if i >= window:
+                old = values[i - window] - mean_all
+                s -= old
+                sq -= old * old
+            count = i + 1 if i < window else window
+            if count < 2:
+                out[i] = np.nan
+                continue
+            var = (sq - s * s / count) / (count - 1)
+            if var <= _VAR_RTOL * sq / (count - 1):
+                out[i] = np.nan
+            else:
+                out[i] = (x - s / count) / np.sqrt(var)
+        return out
+
+    @njit(cache=True)
+    def rolling_corr(a: np.ndarray, b: np.ndarray, window: int) -> np.ndarray:  # pragma: no cover - jitted
+        n = a.size
+        out = np.empty(n, dtype=np.float64)
+        if n == 0:
+            return out
+
+        mean_a = 0.0
+        mean_b = 0.0
+        for i in range(n):
+            mean_a += a[i]
+            mean_b += b[i]
+        mean_a /= n
+        mean_b /= n
+
+        s_a = 0.0
+        s_b = 0.0
+        s_aa = 0.0
+        s_bb = 0.0
+        s_ab = 0.0
+        for i in range(n):
+            xa = a[i] - mean_a
+            xb = b[i] - mean_b
+            s_a += xa
+            s_b += xb
+            s_aa += xa * xa
+            s_bb += xb * xb
+            s_ab += xa * xb
+            if i >= window:
+                oa = a[i - window] - mean_a
+                ob = b[i - window] - mean_b
+                s_a -= oa
+                s_b -= ob
+                s_aa -= oa * oa
+                s_bb -= ob * ob
+                s_ab -= oa * ob
+            count = i + 1 if i < window else window
+            if count < 2:
+                out[i] = np.nan
+                continue
+            var_a = s_aa - s_a * s_a / count
+            var_b = s_bb - s_b * s_b / count
+            if var_a <= _VAR_RTOL * s_aa or var_b <= _VAR_RTOL * s_bb:
+                out[i] = np.nan
+                continue
+            corr = (s_ab - s_a * s_b / count) / np.sqrt(var_a * var_b)
+            if corr > 1.0:
+                corr = 1.0
+            elif corr < -1.0:
+                corr = -1.0
+            out[i] = corr
+        return out
+
+else:  # pragma: no cover - numba not installed
+    rolling_zscore = None
+    rolling_corr = None
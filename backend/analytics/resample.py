@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Iterable, Union
 
+import numpy as np
 import pandas as pd
 
 from backend.schemas.tick import Tick
@@ -12,21 +13,38 @@ from backend.schemas.tick import Tick
 def ticks_to_dataframe(ticks: Iterable[Union[dict, Tick]]) -> pd.DataFrame:
     """Convert ticks to a pandas DataFrame indexed by timestamp."""
 
-    records = []
+    symbols: list = []
+    timestamps: list = []
+    prices: list = []
+    sizes: list = []
     for tick in ticks:
         if isinstance(tick, Tick):
-            records.append(tick.dict())
+            symbols.append(tick.symbol)
+            timestamps.append(tick.ts)
+            prices.append(tick.price)
+            sizes.append(tick.size)
         else:
-            records.append(tick)
-
-    df = pd.DataFrame.from_records(records)
-    if df.empty:
-        return df
-
-    df = df.copy()
-    df["ts"] = pd.to_datetime(df["ts"], utc=True)
-    df.set_index("ts", inplace=True)
-    return df.sort_index()
+            symbols.append(tick["symbol"])
+            timestamps.append(tick["ts"])
+            prices.append(tick["price"])
+            sizes.append(tick["size"])
+
+    if not timestamps:
+        return pd.DataFrame()
+
+    # Build each column as a typed array up front instead of handing pandas a
+    # list of per-tick dicts to reflect over.
+    df = pd.DataFrame(
+        {
+            "symbol": symbols,
+            "price": np.asarray(prices, dtype=np.float64),
+            "size": np.asarray(sizes, dtype=np.float64),
+        },
+        index=pd.DatetimeIndex(pd.to_datetime(timestamps, utc=True), name="ts"),
+    )
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index()
+    return df
 
 
 def resample_ohlcv(
@@ -40,9 +58,12 @@ def resample_ohlcv(
     if df.empty:
         return pd.DataFrame(columns=["open", "high", "low", "close", "volume"])
 
-    ohlc = df[price_column].resample(timeframe).ohlc()
-    volume = df[size_column].resample(timeframe).sum().rename("volume")
-    result = pd.concat([ohlc, volume], axis=1)
+    # Aggregate price and volume in one resample walk instead of building two
+    # intermediate frames and concatenating them.
+    result = df.resample(timeframe).agg(
+        {price_column: ["first", "max", "min", "last"], size_column: "sum"}
+    )
+    result.columns = ["open", "high", "low", "close", "volume"]
     return result.dropna(how="all")
 
 
@@ -7,6 +7,16 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional accelerator
+    uvloop = None
+else:
+    # libuv-based event loop: cuts loop overhead on the websocket-heavy
+    # ingest and broadcast paths. Must be installed before any loop exists.
+    uvloop.install()
+
+from backend.analytics import warmup_kernels
 from backend.app.routers import api_router
 from backend.core.config import settings
 from backend.services import (
@@ -21,7 +31,11 @@ from backend.storage import init_db
 async def lifespan(app: FastAPI):  # pragma: no cover - integration setup
     init_db()
     ingest_service.add_subscriber(persistence_worker.queue)
-    
+
+    # Warm the analytics kernels off the loop so the first real request
+    # doesn't absorb lazy scipy/statsmodels setup cost.
+    asyncio.create_task(asyncio.to_thread(warmup_kernels))
+
     # Start services in background without blocking - allow REST API to start even if WebSocket fails
     # Use asyncio.create_task to start services in background without waiting
     async def start_services_async():
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Dict, List
+import asyncio
+from typing import List
 
+import numpy as np
+import pandas as pd
 from fastapi import APIRouter, HTTPException, Query
 
 from backend.core.config import settings
@@ -14,7 +17,12 @@ from backend.schemas import (
     HedgeRatioPayload,
     HedgeRatioResponse,
 )
-from backend.services import compute_pair_metrics, ingest_service
+from backend.services import (
+    compute_pair_hedge_only,
+    compute_pair_metrics_from_series,
+    ingest_service,
+)
+from backend.services.metrics import _price_series, resample_ticks
 from backend.storage import fetch_recent_ticks
 
 router = APIRouter()
@@ -40,16 +48,45 @@ def _resolve_timeframe(timeframe: str | None) -> str | None:
 def _merge_ticks(symbol: str, limit: int) -> List:
     db_ticks = fetch_recent_ticks(symbol, limit)
     buffer_ticks = ingest_service.buffer.snapshot(symbol)
-    seen: Dict[str, object] = {}
-    for tick in db_ticks + buffer_ticks:
-        seen[tick.ts.isoformat()] = tick
-    merged = sorted(seen.values(), key=lambda t: t.ts)
+    all_ticks = db_ticks + buffer_ticks
+    if not all_ticks:
+        return []
+
+    # Dedupe on integer microsecond timestamps instead of formatting an ISO
+    # string per tick. A stable argsort keeps the original order within equal
+    # timestamps, so keeping the last of each run lets buffer ticks override
+    # their persisted copies, matching the old dict semantics.
+    ts = np.fromiter(
+        (int(round(t.ts.timestamp() * 1e6)) for t in all_ticks),
+        dtype=np.int64,
+        count=len(all_ticks),
+    )
+    order = np.argsort(ts, kind="stable")
+    sorted_ts = ts[order]
+    keep = np.empty(len(all_ticks), dtype=bool)
+    keep[:-1] = sorted_ts[1:] != sorted_ts[:-1]
+    keep[-1] = True
+    merged = [all_ticks[i] for i in order[keep]]
     if len(merged) > limit:
         merged = merged[-limit:]
     return merged
 
 
-async def _prepare_ticks(symbol: str, window: int, timeframe: str) -> List:
+# Resampled frames keyed by (symbol, timeframe, tick count, last tick ts).
+# The key changes whenever a new tick lands, so entries can never go stale;
+# repeated dashboard polls between ticks reuse the previous result.
+_RESAMPLE_CACHE: dict = {}
+_RESAMPLE_CACHE_MAX = 64
+
+
+async def _prepare_series(symbol: str, window: int, timeframe: str) -> pd.Series:
+    """Return the price series to analyse for one symbol.
+
+    Works in series space end to end: the resampled frame's close column is
+    used directly instead of rebuilding per-bar Tick objects that the metrics
+    layer would immediately flatten back into a series.
+    """
+
     await ingest_service.add_symbol(symbol)
     limit = max(window * 5, 2000)
     ticks = _merge_ticks(symbol, limit)
@@ -58,91 +95,94 @@ async def _prepare_ticks(symbol: str, window: int, timeframe: str) -> List:
 
     resolved = _resolve_timeframe(timeframe)
     if resolved is None:
-        return ticks
-
-    from backend.services.metrics import resample_ticks as resample_helper
-    from backend.schemas.tick import Tick
-    from datetime import timezone
-
-    df = resample_helper(ticks, resolved).dropna()
-
-    resampled: List[Tick] = []
-    for ts, row in df.iterrows():
-        resampled.append(
-            Tick(
-                symbol=symbol,
-                ts=ts.to_pydatetime().astimezone(timezone.utc),
-                price=float(row["close"]),
-                size=float(row.get("volume", 0.0) or 0.0),
-            )
-        )
-    return resampled or ticks
+        return _price_series(ticks)
+
+    cache_key = (symbol, resolved, len(ticks), ticks[-1].ts)
+    df = _RESAMPLE_CACHE.get(cache_key)
+    if df is None:
+        df = resample_ticks(ticks, resolved).dropna()
+        if len(_RESAMPLE_CACHE) >= _RESAMPLE_CACHE_MAX:
+            _RESAMPLE_CACHE.pop(next(iter(_RESAMPLE_CACHE)))
+        _RESAMPLE_CACHE[cache_key] = df
+
+    if df.empty:
+        return _price_series(ticks)
+    return df["close"].astype(float)
+
+
+# Shared zeroed response for the no-data and degenerate-input paths; built
+# once instead of re-validating the same Pydantic payload on every failure.
+_EMPTY_ANALYTICS = AnalyticsResponse(
+    hedge_ratio=HedgeRatioResponse(
+        beta=0.0, intercept=0.0, rvalue=None, pvalue=None, stderr=None
+    ),
+    latest_spread=None,
+    latest_zscore=None,
+    rolling_correlation=None,
+    adf=None,
+)
 
 
 async def _compute(request: AnalyticsRequest, include_adf: bool) -> AnalyticsResponse:
-    from backend.schemas import HedgeRatioResponse
-    
     try:
-        ticks_a = await _prepare_ticks(request.symbol_a, request.window, request.timeframe)
-        ticks_b = await _prepare_ticks(request.symbol_b, request.window, request.timeframe)
+        series_a = await _prepare_series(request.symbol_a, request.window, request.timeframe)
+        series_b = await _prepare_series(request.symbol_b, request.window, request.timeframe)
     except HTTPException as exc:
         # If no data available, return empty analytics instead of 404
         if exc.status_code == 404:
-            return AnalyticsResponse(
-                hedge_ratio=HedgeRatioResponse(
-                    beta=0.0, intercept=0.0, rvalue=None, pvalue=None, stderr=None
-                ),
-                latest_spread=None,
-                latest_zscore=None,
-                rolling_correlation=None,
-                adf=None,
-            )
+            return _EMPTY_ANALYTICS
         raise
-    except Exception as exc:
-        # Return empty analytics on any other error
-        return AnalyticsResponse(
-            hedge_ratio=HedgeRatioResponse(
-                beta=0.0, intercept=0.0, rvalue=None, pvalue=None, stderr=None
-            ),
-            latest_spread=None,
-            latest_zscore=None,
-            rolling_correlation=None,
-            adf=None,
-        )
-    
+
+    # Cheap preflight: don't even attempt alignment/regression when either
+    # side clearly cannot support it.
+    if len(series_a) < 2 or len(series_b) < 2:
+        return _EMPTY_ANALYTICS
+
     try:
-        analytics, _ = compute_pair_metrics(
-            ticks_a,
-            ticks_b,
+        # The pair pipeline is CPU-bound (alignment, OLS, rolling kernels,
+        # optionally ADF); run it on a worker thread so concurrent requests
+        # don't stall the event loop. The NumPy kernels release the GIL for
+        # their array passes, so overlapping requests genuinely overlap.
+        analytics, _ = await asyncio.to_thread(
+            compute_pair_metrics_from_series,
+            series_a,
+            series_b,
             window=request.window,
             include_intercept=request.include_intercept,
             adf=include_adf,
         )
         return analytics
-    except Exception:
-        # Return empty analytics if computation fails (e.g., insufficient data)
-        return AnalyticsResponse(
-            hedge_ratio=HedgeRatioResponse(
-                beta=0.0, intercept=0.0, rvalue=None, pvalue=None, stderr=None
-            ),
-            latest_spread=None,
-            latest_zscore=None,
-            rolling_correlation=None,
-            adf=None,
-        )
+    except (ValueError, np.linalg.LinAlgError):
+        # Numerical corner cases: insufficient overlap, zero variance, etc.
+        return _EMPTY_ANALYTICS
 
 
 @router.post("/hedge-ratio", response_model=HedgeRatioResponse)
 async def hedge_ratio(payload: HedgeRatioPayload) -> HedgeRatioResponse:
-    request = AnalyticsRequest(
-        symbol_a=payload.symbol_a,
-        symbol_b=payload.symbol_b,
-        window=settings.analytics_window,
-        timeframe="tick",
-        include_intercept=payload.include_intercept,
+    empty = HedgeRatioResponse(
+        beta=0.0, intercept=0.0, rvalue=None, pvalue=None, stderr=None
     )
-    analytics = await _compute(request, include_adf=False)
-    return analytics.hedge_ratio
+    try:
+        series_a = await _prepare_series(
+            payload.symbol_a, settings.analytics_window, "tick"
+        )
+        series_b = await _prepare_series(
+            payload.symbol_b, settings.analytics_window, "tick"
+        )
+    except HTTPException as exc:
+        if exc.status_code == 404:
+            return empty
+        raise
+    try:
+        return await asyncio.to_thread(
+            compute_pair_hedge_only,
+            series_a,
+            series_b,
+            include_intercept=payload.include_intercept,
+        )
+    except ValueError:
+        # Insufficient or degenerate data for a regression
+        return empty
 
 
 @router.post("/snapshot", response_model=AnalyticsResponse)
@@ -4,14 +4,21 @@ from __future__ import annotations
 
 import io
 from datetime import datetime
-from typing import List
+from typing import List, Literal
 
+import orjson
 import pandas as pd
 from fastapi import APIRouter, File, HTTPException, Query, UploadFile
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pragma: no cover - optional accelerator
+    pa = None
 
 from backend.schemas import HistoryResponse, OHLCBar
-from backend.services import ingest_service, resample_ticks
+from backend.services import ingest_service, resample_ticks, resample_ticks_df
 from backend.storage import fetch_recent_ticks
 
 router = APIRouter()
@@ -24,6 +31,10 @@ TIMEFRAME_MAP = {
 }
 
 
+# Rows per encoded chunk when streaming CSV exports.
+_EXPORT_CHUNK_ROWS = 5_000
+
+
 def _resolve_timeframe(timeframe: str) -> str:
     tf = TIMEFRAME_MAP.get(timeframe.lower())
     if not tf:
@@ -32,43 +43,96 @@ def _resolve_timeframe(timeframe: str) -> str:
 
 
 def _bars_from_dataframe(df: pd.DataFrame) -> List[OHLCBar]:
-    bars: List[OHLCBar] = []
-    for ts, row in df.iterrows():
-        if row.isna().all():
-            continue
-        bars.append(
-            OHLCBar(
-                ts=ts.to_pydatetime() if hasattr(ts, "to_pydatetime") else datetime.fromisoformat(str(ts)),
-                open=float(row["open"]) if pd.notna(row["open"]) else 0.0,
-                high=float(row["high"]) if pd.notna(row["high"]) else 0.0,
-                low=float(row["low"]) if pd.notna(row["low"]) else 0.0,
-                close=float(row["close"]) if pd.notna(row["close"]) else 0.0,
-                volume=float(row.get("volume", 0.0) or 0.0) if pd.notna(row.get("volume", 0.0)) else 0.0,
-            )
-        )
-    return bars
+    if df.empty:
+        return []
+
+    # Drop all-NaN rows and pull the frame into plain Python objects in bulk:
+    # iterrows() boxes a Series per row, which dominates on large histories.
+    # tolist() already yields Python floats, so no per-cell float()/notna().
+    clean = df.dropna(how="all")
+    if clean.empty:
+        return []
+    if "volume" not in clean.columns:
+        clean = clean.assign(volume=0.0)
+    values = (
+        clean[["open", "high", "low", "close", "volume"]].fillna(0.0).to_numpy().tolist()
+    )
+    ts_list = clean.index.to_pydatetime()
+    # construct() skips validation — every field is already a Python float
+    # (or datetime) straight out of the typed arrays above.
+    return [
+        OHLCBar.construct(ts=ts, open=o, high=h, low=l, close=c, volume=v)
+        for ts, (o, h, l, c, v) in zip(ts_list, values)
+    ]
+
+
+def _bars_payload(df: pd.DataFrame) -> list[dict]:
+    """Bar dicts ready for orjson — same bulk extraction as
+    ``_bars_from_dataframe`` but without the response-model detour."""
+
+    if df.empty:
+        return []
+    clean = df.dropna(how="all")
+    if clean.empty:
+        return []
+    if "volume" not in clean.columns:
+        clean = clean.assign(volume=0.0)
+    values = (
+        clean[["open", "high", "low", "close", "volume"]].fillna(0.0).to_numpy().tolist()
+    )
+    ts_list = clean.index.to_pydatetime()
+    return [
+        {"ts": ts, "open": o, "high": h, "low": l, "close": c, "volume": v}
+        for ts, (o, h, l, c, v) in zip(ts_list, values)
+    ]
+
+
+# Encoded /history bodies keyed by (symbol, timeframe, limit, latest tick
+# ts). The key changes whenever a tick arrives for the symbol, so entries
+# invalidate themselves; polls between ticks become a dict lookup and skip
+# both the resample and the response-model serialization.
+_HISTORY_CACHE: dict = {}
+_HISTORY_CACHE_MAX = 512
+
+
+def _latest_buffer_ts(symbol: str) -> int | None:
+    ring = ingest_service.buffer.data.get(symbol)
+    if ring is not None:
+        return ring.last_ts()
+    return None
 
 
 @router.get("/history", response_model=HistoryResponse)
 async def history(
     symbol: str = Query(..., description="Symbol to fetch"),
-    timeframe: str = Query("1s", regex="^(1s|1m|5m)$"),
+    timeframe: Literal["1s", "1m", "5m"] = Query("1s"),
     limit: int = Query(3000, ge=10, le=50_000),
-) -> HistoryResponse:
+) -> Response:
     symbol = symbol.lower()
     await ingest_service.add_symbol(symbol)
-    ticks = fetch_recent_ticks(symbol, limit=limit)
-    if not ticks:
-        return HistoryResponse(symbol=symbol, timeframe=timeframe, bars=[])
 
-    df = resample_ticks(ticks, _resolve_timeframe(timeframe))
-    bars = _bars_from_dataframe(df.tail(limit))
-    return HistoryResponse(symbol=symbol, timeframe=timeframe, bars=bars)
+    cache_key = (symbol, timeframe, limit, _latest_buffer_ts(symbol))
+    body = _HISTORY_CACHE.get(cache_key)
+    if body is None:
+        ticks = fetch_recent_ticks(symbol, limit=limit)
+        bars: list[dict] = []
+        if ticks:
+            df = resample_ticks(ticks, _resolve_timeframe(timeframe))
+            bars = _bars_payload(df.tail(limit))
+        # One orjson pass over plain dicts; walking a HistoryResponse of up
+        # to 50k Pydantic bars through .json() was the dominant cost of
+        # large responses. response_model stays for the OpenAPI schema.
+        body = orjson.dumps({"symbol": symbol, "timeframe": timeframe, "bars": bars})
+        if len(_HISTORY_CACHE) >= _HISTORY_CACHE_MAX:
+            _HISTORY_CACHE.pop(next(iter(_HISTORY_CACHE)))
+        _HISTORY_CACHE[cache_key] = body
+
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/export")
 async def export(
-    symbol: str = Query(...), timeframe: str = Query("1s"), limit: int = Query(5000, ge=10, le=100_000)
+    symbol: str = Query(...), timeframe: Literal["1s", "1m", "5m"] = Query("1s"), limit: int = Query(5000, ge=10, le=100_000)
 ):
     symbol = symbol.lower()
     await ingest_service.add_symbol(symbol)
@@ -77,30 +141,60 @@ async def export(
         raise HTTPException(status_code=404, detail="No data available for export")
 
     df = resample_ticks(ticks, _resolve_timeframe(timeframe)).reset_index()
-    buffer = io.StringIO()
     df.rename(columns={"index": "ts"}, inplace=True)
-    df.to_csv(buffer, index=False)
-    buffer.seek(0)
+
+    def generate_csv():
+        # Emit the header, then encode in slices so the response starts
+        # streaming immediately instead of materializing the whole CSV
+        # (tens of MB at the max export limit) in memory first.
+        yield df.iloc[:0].to_csv(index=False)
+        for start in range(0, len(df), _EXPORT_CHUNK_ROWS):
+            yield df.iloc[start : start + _EXPORT_CHUNK_ROWS].to_csv(
+                index=False, header=False
+            )
 
     filename = f"{symbol}_{timeframe}_{datetime.utcnow().isoformat().replace(':', '-')}.csv"
     headers = {"Content-Disposition": f"attachment; filename={filename}"}
-    return StreamingResponse(buffer, media_type="text/csv", headers=headers)
+    return StreamingResponse(generate_csv(), media_type="text/csv", headers=headers)
 
 
 @router.post("/upload", response_model=HistoryResponse)
 async def upload(
     file: UploadFile = File(...),
-    timeframe: str = Query("1s", regex="^(1s|1m|5m)$"),
+    timeframe: Literal["1s", "1m", "5m"] = Query("1s"),
     symbol: str | None = Query(None, description="Optional symbol override"),
 ) -> HistoryResponse:
     contents = await file.read()
     if not contents:
         raise HTTPException(status_code=400, detail="Empty file uploaded")
 
-    try:
-        df = pd.read_csv(io.BytesIO(contents))
-    except Exception as exc:  # pragma: no cover - pandas parsing error
-        raise HTTPException(status_code=400, detail=f"Failed to parse CSV: {exc}") from exc
+    df = None
+    if pa is not None:
+        # pyarrow's multi-threaded CSV reader is several times faster than
+        # pandas' parser on large numeric uploads; pre-declaring the numeric
+        # columns skips a second inference pass. Any arrow-side failure falls
+        # back to the pandas parser below.
+        try:
+            table = pa_csv.read_csv(
+                pa.BufferReader(contents),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={
+                        "ts": pa.timestamp("ns", tz="UTC"),
+                        "price": pa.float64(),
+                        "size": pa.float64(),
+                        "volume": pa.float64(),
+                    }
+                ),
+            )
+            df = table.to_pandas()
+        except Exception:  # pragma: no cover - fall back to pandas parser
+            df = None
+
+    if df is None:
+        try:
+            df = pd.read_csv(io.BytesIO(contents))
+        except Exception as exc:  # pragma: no cover - pandas parsing error
+            raise HTTPException(status_code=400, detail=f"Failed to parse CSV: {exc}") from exc
 
     timestamp_col = next((col for col in ("ts", "timestamp", "time") if col in df.columns), None)
     if not timestamp_col:
@@ -127,8 +221,10 @@ async def upload(
     if filtered.empty:
         raise HTTPException(status_code=400, detail="No rows matched the provided symbol")
 
-    ticks = filtered[["ts", "symbol", "price", "size"]].to_dict("records")
-    df_resampled = resample_ticks(ticks, _resolve_timeframe(timeframe))
+    # Resample the parsed frame directly instead of exploding it into dicts
+    # that resample_ticks would immediately rebuild into a frame.
+    frame = filtered[["ts", "price", "size"]].set_index("ts").sort_index()
+    df_resampled = resample_ticks_df(frame, _resolve_timeframe(timeframe))
     bars = _bars_from_dataframe(df_resampled)
 
     return HistoryResponse(symbol=target_symbol, timeframe=timeframe, bars=bars)
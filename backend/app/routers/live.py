@@ -15,11 +15,11 @@ async def live_metrics(websocket: WebSocket) -> None:
     queue = live_metrics_stream.subscribe()
     try:
         while True:
-            payload = await queue.get()
-            await websocket.send_json(payload)
+            # Frames arrive pre-encoded from LiveMetricsStream, so the
+            # route just pumps them out as text (the frontend hook
+            # JSON.parses event.data and expects text frames).
+            await websocket.send_text(await queue.get())
     except WebSocketDisconnect:
         pass
     finally:
         live_metrics_stream.unsubscribe(queue)
-
-
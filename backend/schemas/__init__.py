@@ -16,10 +16,11 @@ from .analytics import (
     HedgeRatioResponse,
 )
 from .data import HistoryResponse, OHLCBar
-from .tick import Tick
+from .tick import RawTick, Tick
 
 __all__ = [
     "Tick",
+    "RawTick",
     "ADFPayload",
     "AnalyticsRequest",
     "AnalyticsResponse",
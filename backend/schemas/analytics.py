@@ -6,6 +6,10 @@ from typing import Dict, Optional
 
 from pydantic import BaseModel, Field, validator
 
+# Accepted resample timeframes; module-level so the validator doesn't
+# rebuild the set on every request.
+_VALID_TF = frozenset({"tick", "1s", "1m", "5m"})
+
 
 class HedgeRatioPayload(BaseModel):
     """Payload describing a hedge ratio computation request."""
@@ -34,10 +38,10 @@ class AnalyticsRequest(BaseModel):
 
     @validator("timeframe")
     def validate_timeframe(cls, value: str) -> str:
-        valid = {"tick", "1s", "1m", "5m"}
-        if value.lower() not in valid:
-            raise ValueError(f"timeframe must be one of {sorted(valid)}")
-        return value.lower()
+        lowered = value.lower()
+        if lowered not in _VALID_TF:
+            raise ValueError(f"timeframe must be one of {sorted(_VALID_TF)}")
+        return lowered
 
 
 class HedgeRatioResponse(BaseModel):
@@ -1,6 +1,7 @@
 """Tick-related request and response models."""
 
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import datetime, timezone
 
 from pydantic import BaseModel, Field
 
@@ -14,4 +15,23 @@ class Tick(BaseModel):
     size: float = Field(..., ge=0, description="Trade size or volume")
 
 
+@dataclass(slots=True)
+class RawTick:
+    """Unvalidated tick used on the ingest hot path.
+
+    Carries the timestamp as integer epoch-nanoseconds straight from the
+    exchange frame; allocating one of these is several times cheaper than a
+    Pydantic model and avoids a datetime per message. The Pydantic ``Tick``
+    remains the shape exposed through the API.
+    """
+
+    symbol: str
+    ts_ns: int
+    price: float
+    size: float
+
+    def to_datetime(self) -> datetime:
+        return datetime.fromtimestamp(self.ts_ns / 1e9, tz=timezone.utc)
+
+
 
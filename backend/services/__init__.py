@@ -4,7 +4,13 @@ from backend.core.config import settings
 from backend.services.alerts import AlertManager
 from backend.services.ingest import BinanceIngestService
 from backend.services.live import LiveMetricsStream
-from backend.services.metrics import compute_pair_metrics, resample_ticks
+from backend.services.metrics import (
+    compute_pair_hedge_only,
+    compute_pair_metrics,
+    compute_pair_metrics_from_series,
+    resample_ticks,
+    resample_ticks_df,
+)
 from backend.services.persistence import TickPersistenceWorker
 
 
@@ -25,8 +31,11 @@ __all__ = [
     "persistence_worker",
     "alert_manager",
     "live_metrics_stream",
+    "compute_pair_hedge_only",
     "compute_pair_metrics",
+    "compute_pair_metrics_from_series",
     "resample_ticks",
+    "resample_ticks_df",
 ]
 
 
@@ -3,22 +3,59 @@
 from __future__ import annotations
 
 import logging
-from collections import deque
+import operator
+from collections import defaultdict, deque
 from datetime import datetime
-from typing import Deque, Dict, List
+from typing import Deque, Dict, List, Tuple
 from uuid import UUID
 
+import numpy as np
+
 from backend.schemas import Alert, AlertCreate, AlertEvent, AlertOperator
 
 LOGGER = logging.getLogger(__name__)
 
 
+# Comparator per operator; a dict lookup plus a C-level operator call
+# replaces the old four-way if/elif chain run per alert per tick.
+_OPS = {
+    AlertOperator.greater: operator.gt,
+    AlertOperator.greater_equal: operator.ge,
+    AlertOperator.less: operator.lt,
+    AlertOperator.less_equal: operator.le,
+}
+
+
 class AlertManager:
     """Manage alert rules and evaluate metrics to emit events."""
 
     def __init__(self, history_limit: int = 500) -> None:
         self._alerts: Dict[UUID, Alert] = {}
         self._history: Deque[AlertEvent] = deque(maxlen=history_limit)
+        # Active alerts compiled by (metric, operator) into a struct-of-arrays
+        # view — packed thresholds plus the event fields as plain tuples —
+        # rebuilt on every mutation. evaluate() then runs one vectorized
+        # compare per group and never touches a Pydantic model attribute on
+        # the tick path (the Alert reference is kept only to stamp
+        # last_triggered on fire).
+        self._groups: Dict[
+            Tuple[str, AlertOperator],
+            Tuple[np.ndarray, List[Alert], List[Tuple[UUID, str]]],
+        ] = {}
+
+    def _rebuild_groups(self) -> None:
+        grouped: Dict[Tuple[str, AlertOperator], List[Alert]] = defaultdict(list)
+        for alert in self._alerts.values():
+            if alert.active:
+                grouped[(alert.metric, alert.operator)].append(alert)
+        self._groups = {
+            key: (
+                np.array([a.threshold for a in alerts], dtype=np.float64),
+                alerts,
+                [(a.id, a.name) for a in alerts],
+            )
+            for key, alerts in grouped.items()
+        }
 
     def list_alerts(self) -> List[Alert]:
         return list(self._alerts.values())
@@ -29,54 +66,47 @@ class AlertManager:
     def create_alert(self, payload: AlertCreate) -> Alert:
         alert = Alert(**payload.dict())
         self._alerts[alert.id] = alert
+        self._rebuild_groups()
         LOGGER.info("Created alert %s (%s %s %s)", alert.name, alert.metric, alert.operator, alert.threshold)
         return alert
 
     def delete_alert(self, alert_id: UUID) -> None:
         if alert_id in self._alerts:
             del self._alerts[alert_id]
+            self._rebuild_groups()
 
     def toggle_alert(self, alert_id: UUID, active: bool) -> Alert:
         alert = self._alerts[alert_id]
         alert.active = active
+        self._rebuild_groups()
         return alert
 
     def history(self) -> List[AlertEvent]:
-        return list(self._history)
+        # Events are appended oldest-to-newest; present newest first, paying
+        # the reversal on the (rare) read instead of the per-tick write.
+        return list(reversed(self._history))
 
     def evaluate(self, metrics: Dict[str, float]) -> List[AlertEvent]:
         triggered: List[AlertEvent] = []
-        for alert in self._alerts.values():
-            if not alert.active:
-                continue
-            value = metrics.get(alert.metric)
+        for (metric, op), (thresholds, alerts, fields) in self._groups.items():
+            value = metrics.get(metric)
             if value is None:
                 continue
-            if self._compare(value, alert.operator, alert.threshold):
+            mask = _OPS[op](value, thresholds)
+            for idx in np.flatnonzero(mask):
+                alert_id, name = fields[idx]
                 event = AlertEvent(
-                    alert_id=alert.id,
-                    name=alert.name,
-                    metric=alert.metric,
-                    operator=alert.operator,
-                    threshold=alert.threshold,
+                    alert_id=alert_id,
+                    name=name,
+                    metric=metric,
+                    operator=op,
+                    threshold=float(thresholds[idx]),
                     metric_value=value,
                     triggered_at=datetime.utcnow(),
                 )
-                alert.last_triggered = event.triggered_at
-                self._history.appendleft(event)
+                alerts[idx].last_triggered = event.triggered_at
+                self._history.append(event)
                 triggered.append(event)
         return triggered
 
-    @staticmethod
-    def _compare(value: float, operator: AlertOperator, threshold: float) -> bool:
-        if operator == AlertOperator.greater:
-            return value > threshold
-        if operator == AlertOperator.greater_equal:
-            return value >= threshold
-        if operator == AlertOperator.less:
-            return value < threshold
-        if operator == AlertOperator.less_equal:
-            return value <= threshold
-        return False
-
 
@@ -3,32 +3,102 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
-from collections import defaultdict, deque
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import AsyncIterator, Deque, Dict, Iterable, Optional, Set
+from typing import AsyncIterator, Dict, Iterable, Optional, Set
 
+import numpy as np
+import orjson
 import websockets
 
-from backend.schemas.tick import Tick
+from backend.schemas.tick import RawTick, Tick
 
 LOGGER = logging.getLogger(__name__)
 
 
+def _ts_to_ns(ts: datetime) -> int:
+    """Convert a datetime to integer epoch-nanoseconds (exact to the µs)."""
+
+    return int(round(ts.timestamp() * 1e6)) * 1_000
+
+
+@dataclass(slots=True)
+class _TickRing:
+    """Preallocated struct-of-arrays ring holding one symbol's recent ticks.
+
+    A fixed int64/float64 column per field replaces the per-element deques:
+    appends are plain array stores and readers get contiguous slices instead
+    of iterating Python objects.
+    """
+
+    ts_ns: np.ndarray
+    price: np.ndarray
+    size: np.ndarray
+    head: int = 0
+    filled: int = 0
+
+    def append(self, ts_ns: int, price: float, size: float) -> None:
+        i = self.head
+        self.ts_ns[i] = ts_ns
+        self.price[i] = price
+        self.size[i] = size
+        self.head = (i + 1) % self.ts_ns.shape[0]
+        if self.filled < self.ts_ns.shape[0]:
+            self.filled += 1
+
+    def __len__(self) -> int:
+        return self.filled
+
+    def last_ts(self) -> Optional[int]:
+        if not self.filled:
+            return None
+        return int(self.ts_ns[(self.head - 1) % self.ts_ns.shape[0]])
+
+    def last_price(self) -> Optional[float]:
+        if not self.filled:
+            return None
+        return float(self.price[(self.head - 1) % self.price.shape[0]])
+
+    def ordered(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return (ts_ns, price, size) copies in oldest-to-newest order."""
+
+        if self.filled < self.ts_ns.shape[0]:
+            view = slice(0, self.filled)
+            return (
+                self.ts_ns[view].copy(),
+                self.price[view].copy(),
+                self.size[view].copy(),
+            )
+        head = self.head
+        return tuple(
+            np.concatenate((column[head:], column[:head]))
+            for column in (self.ts_ns, self.price, self.size)
+        )
+
+
 @dataclass(slots=True)
 class TickBuffer:
-    """In-memory hot store for recent ticks per symbol."""
+    """In-memory hot store for recent ticks per symbol.
+
+    Ticks are stored column-wise in preallocated ring buffers (int64 ns
+    timestamps, float prices/sizes) so analytics consumers can pull
+    contiguous NumPy arrays without walking per-tick objects.
+    """
 
     maxlen: int
-    data: Dict[str, Deque[Tick]] = field(init=False)
+    data: Dict[str, _TickRing] = field(init=False)
 
     def __post_init__(self) -> None:
-        self.data = defaultdict(self._deque_factory)
+        self.data = defaultdict(self._ring_factory)
 
-    def _deque_factory(self) -> Deque[Tick]:
-        return deque(maxlen=self.maxlen)
+    def _ring_factory(self) -> _TickRing:
+        return _TickRing(
+            ts_ns=np.zeros(self.maxlen, dtype=np.int64),
+            price=np.zeros(self.maxlen, dtype=np.float64),
+            size=np.zeros(self.maxlen, dtype=np.float64),
+        )
 
     def configure(self, symbols: Iterable[str]) -> None:
         for symbol in symbols:
@@ -36,14 +106,40 @@ class TickBuffer:
 
     def ensure_symbol(self, symbol: str) -> None:
         if symbol not in self.data:
-            self.data[symbol] = self._deque_factory()
+            self.data[symbol] = self._ring_factory()
 
     def append(self, tick: Tick) -> None:
-        self.ensure_symbol(tick.symbol)
-        self.data[tick.symbol].append(tick)
+        self.append_raw(tick.symbol, _ts_to_ns(tick.ts), tick.price, tick.size)
+
+    def append_raw(self, symbol: str, ts_ns: int, price: float, size: float) -> None:
+        """Append already-unpacked scalars, skipping the datetime round trip."""
+
+        self.ensure_symbol(symbol)
+        self.data[symbol].append(ts_ns, price, size)
 
     def snapshot(self, symbol: str) -> list[Tick]:
-        return list(self.data.get(symbol, []))
+        ring = self.data.get(symbol)
+        if ring is None or not ring.filled:
+            return []
+        ts_ns, price, size = ring.ordered()
+        return [
+            Tick.construct(
+                symbol=symbol,
+                ts=datetime.fromtimestamp(t / 1e9, tz=timezone.utc),
+                price=p,
+                size=s,
+            )
+            for t, p, s in zip(ts_ns.tolist(), price.tolist(), size.tolist())
+        ]
+
+    def snapshot_arrays(self, symbol: str) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return (ts_ns, price, size) as contiguous NumPy arrays."""
+
+        ring = self.data.get(symbol)
+        if ring is None:
+            empty = np.empty(0)
+            return empty.astype(np.int64), empty, empty
+        return ring.ordered()
 
 
 class BinanceIngestService:
@@ -53,18 +149,18 @@ class BinanceIngestService:
         self,
         symbols: Optional[Iterable[str]] = None,
         *,
-        queue: Optional[asyncio.Queue[Tick]] = None,
+        queue: Optional[asyncio.Queue[RawTick]] = None,
         buffer_size: int = 3_600,
         reconnect_delay: float = 5.0,
     ) -> None:
         self.symbols = {s.lower() for s in (symbols or [])}
-        self.queue: asyncio.Queue[Tick] = queue or asyncio.Queue()
+        self.queue: asyncio.Queue[RawTick] = queue or asyncio.Queue()
         self.buffer = TickBuffer(maxlen=buffer_size)
         self.buffer.configure(self.symbols)
         self.reconnect_delay = reconnect_delay
         self._tasks: set[asyncio.Task] = set()
         self._running = asyncio.Event()
-        self._subscribers: Set[asyncio.Queue[Tick]] = set()
+        self._subscribers: Set[asyncio.Queue[RawTick]] = set()
 
     def update_symbols(self, symbols: Iterable[str]) -> None:
         self.symbols = {s.lower() for s in symbols}
@@ -117,10 +213,14 @@ class BinanceIngestService:
                     async for message in websocket:
                         if not self._running.is_set():
                             break
-                        tick = self._parse_message(symbol, message)
-                        if tick is None:
+                        parsed = self._parse_message(symbol, message)
+                        if parsed is None:
                             continue
-                        self.buffer.append(tick)
+                        ts_ns, price, size = parsed
+                        self.buffer.append_raw(symbol, ts_ns, price, size)
+                        # Queue consumers get the slots dataclass; the
+                        # Pydantic Tick is only materialised at API edges.
+                        tick = RawTick(symbol=symbol, ts_ns=ts_ns, price=price, size=size)
                         await self.queue.put(tick)
                         await self._broadcast(tick)
             except asyncio.TimeoutError:
@@ -134,10 +234,18 @@ class BinanceIngestService:
                 await asyncio.sleep(self.reconnect_delay)
 
     @staticmethod
-    def _parse_message(symbol: str, message: str) -> Optional[Tick]:
+    def _parse_message(symbol: str, message: str) -> Optional[tuple[int, float, float]]:
+        """Parse a trade frame into raw (ts_ns, price, size) scalars.
+
+        Timestamps stay integer nanoseconds on the hot path; datetime
+        objects are only materialised at the edges that need them.
+        """
+
         try:
-            payload = json.loads(message)
-        except json.JSONDecodeError:
+            # orjson takes str or bytes frames directly; its ValueError
+            # subsumes the stdlib JSONDecodeError.
+            payload = orjson.loads(message)
+        except ValueError:
             LOGGER.debug("Failed to decode message for %s", symbol)
             return None
 
@@ -148,27 +256,23 @@ class BinanceIngestService:
         if ts_ms is None:
             return None
 
-        ts = datetime.fromtimestamp(ts_ms / 1000, tz=timezone.utc)
-        price = float(payload.get("p"))
-        quantity = float(payload.get("q"))
-
-        return Tick(symbol=symbol, ts=ts, price=price, size=quantity)
+        return int(ts_ms) * 1_000_000, float(payload.get("p")), float(payload.get("q"))
 
-    async def stream(self) -> AsyncIterator[Tick]:
+    async def stream(self) -> AsyncIterator[RawTick]:
         """Yield ticks as they arrive from the primary queue."""
 
         while True:
             tick = await self.queue.get()
             yield tick
 
-    def add_subscriber(self, subscriber_queue: asyncio.Queue[Tick]) -> None:
+    def add_subscriber(self, subscriber_queue: asyncio.Queue[RawTick]) -> None:
         self._subscribers.add(subscriber_queue)
 
-    def remove_subscriber(self, subscriber_queue: asyncio.Queue[Tick]) -> None:
+    def remove_subscriber(self, subscriber_queue: asyncio.Queue[RawTick]) -> None:
         self._subscribers.discard(subscriber_queue)
 
-    async def _broadcast(self, tick: Tick) -> None:
-        stale_subscribers: set[asyncio.Queue[Tick]] = set()
+    async def _broadcast(self, tick: RawTick) -> None:
+        stale_subscribers: set[asyncio.Queue[RawTick]] = set()
         for subscriber in self._subscribers:
             if subscriber.full():
                 LOGGER.debug("Dropping tick for slow subscriber")
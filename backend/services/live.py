@@ -7,9 +7,14 @@ import logging
 from datetime import datetime
 from typing import Any, Dict, Optional, Set
 
+import orjson
+
 from backend.core.config import settings
 from backend.schemas import AlertEvent
-from backend.services.metrics import compute_pair_metrics
+from backend.services.metrics import (
+    compute_pair_metrics_from_series,
+    price_series_from_arrays,
+)
 
 LOGGER = logging.getLogger(__name__)
 
@@ -25,6 +30,12 @@ class LiveMetricsStream:
         self._tick_queue: Optional[asyncio.Queue] = None
         self._subscribers: Set[asyncio.Queue] = set()
         self._latest_payload: Optional[Dict[str, Any]] = None
+        self._latest_frame: Optional[str] = None
+        # One-entry memo for the last pair computation, keyed on both ring
+        # states: back-to-back queue items with unchanged buffers (e.g. a
+        # burst already drained into the rings) reuse the previous result.
+        self._metrics_cache_key: Optional[tuple] = None
+        self._metrics_cache_val: Optional[tuple] = None
 
     async def start(self) -> None:
         if self._running:
@@ -56,37 +67,81 @@ class LiveMetricsStream:
             return
         sym_a, sym_b = default_symbols[:2]
         window = settings.analytics_window
+        interval = settings.websocket_broadcast_interval
         try:
             while self._running and self._tick_queue is not None:
                 tick = await self._tick_queue.get()
-                analytics, metrics_map = compute_pair_metrics(
-                    self._ingest_service.buffer.snapshot(sym_a),
-                    self._ingest_service.buffer.snapshot(sym_b),
-                    window=window,
-                    include_intercept=True,
-                    adf=False,
+                # Drain whatever burst is queued behind it: subscribers only
+                # see one frame per broadcast interval, so K ticks inside one
+                # interval collapse into a single compute from the latest
+                # buffer state instead of K full metric passes.
+                while True:
+                    try:
+                        tick = self._tick_queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        break
+                buffer = self._ingest_service.buffer
+                ring_a = buffer.data.get(sym_a)
+                ring_b = buffer.data.get(sym_b)
+                # Last price is part of the key: with a full ring len is
+                # pinned at the buffer size, and exchange timestamps are
+                # millisecond-granular, so (len, last_ts) alone can collide
+                # across consecutive trades.
+                cache_key = (
+                    len(ring_a) if ring_a is not None else 0,
+                    ring_a.last_ts() if ring_a is not None else None,
+                    ring_a.last_price() if ring_a is not None else None,
+                    len(ring_b) if ring_b is not None else 0,
+                    ring_b.last_ts() if ring_b is not None else None,
+                    ring_b.last_price() if ring_b is not None else None,
+                    window,
                 )
+                if cache_key == self._metrics_cache_key:
+                    analytics, metrics_map = self._metrics_cache_val
+                else:
+                    # Read the ring buffers as columns — no per-tick object
+                    # materialization on either leg.
+                    ts_a, price_a, _ = buffer.snapshot_arrays(sym_a)
+                    ts_b, price_b, _ = buffer.snapshot_arrays(sym_b)
+                    analytics, metrics_map = compute_pair_metrics_from_series(
+                        price_series_from_arrays(ts_a, price_a),
+                        price_series_from_arrays(ts_b, price_b),
+                        window=window,
+                        include_intercept=True,
+                        adf=False,
+                    )
+                    self._metrics_cache_key = cache_key
+                    self._metrics_cache_val = (analytics, metrics_map)
 
                 alerts = self._alert_manager.evaluate(metrics_map)
                 payload = self._build_payload(tick, analytics.dict(), alerts)
                 self._latest_payload = payload
-                await self._broadcast(payload)
+                # Encode once here: every subscriber receives the same frame,
+                # so K websocket clients share one serialization per tick
+                # instead of each encoding the dict independently. Decoded to
+                # str because the wire frame must stay text — the frontend
+                # hook JSON.parses event.data and would get a Blob otherwise.
+                frame = orjson.dumps(payload).decode()
+                self._latest_frame = frame
+                await self._broadcast(frame)
+                # Let the next burst accumulate before recomputing.
+                await asyncio.sleep(interval)
         except asyncio.CancelledError:
             LOGGER.debug("Live metrics stream cancelled")
 
-    async def _broadcast(self, payload: Dict[str, Any]) -> None:
+    async def _broadcast(self, frame: str) -> None:
         for subscriber in list(self._subscribers):
             if subscriber.full():
                 continue
             try:
-                subscriber.put_nowait(payload)
+                subscriber.put_nowait(frame)
             except Exception:  # pragma: no cover - defensive
                 self._subscribers.discard(subscriber)
 
     def subscribe(self) -> asyncio.Queue:
         queue: asyncio.Queue = asyncio.Queue(maxsize=200)
-        if self._latest_payload is not None:
-            queue.put_nowait(self._latest_payload)
+        if self._latest_frame is not None:
+            queue.put_nowait(self._latest_frame)
         self._subscribers.add(queue)
         return queue
 
@@ -98,12 +153,32 @@ class LiveMetricsStream:
 
     @staticmethod
     def _build_payload(tick, analytics: Dict[str, Any], alerts: list[AlertEvent]) -> Dict[str, Any]:
+        if hasattr(tick, "to_datetime"):
+            timestamp = tick.to_datetime().isoformat()
+        elif hasattr(tick, "ts"):
+            timestamp = tick.ts.isoformat()
+        else:
+            timestamp = datetime.utcnow().isoformat()
         return {
-            "timestamp": tick.ts.isoformat() if hasattr(tick, "ts") else datetime.utcnow().isoformat(),
+            "timestamp": timestamp,
             "symbol": getattr(tick, "symbol", None),
             "price": getattr(tick, "price", None),
             "analytics": analytics,
-            "alerts": [event.dict() for event in alerts],
+            # Read the event fields directly instead of .dict(): Pydantic's
+            # per-call field walk is measurable at tick frequency, and orjson
+            # serializes the UUID/enum/datetime values natively either way.
+            "alerts": [
+                {
+                    "alert_id": event.alert_id,
+                    "name": event.name,
+                    "metric": event.metric,
+                    "operator": event.operator,
+                    "threshold": event.threshold,
+                    "metric_value": event.metric_value,
+                    "triggered_at": event.triggered_at,
+                }
+                for event in alerts
+            ],
         }
 
 
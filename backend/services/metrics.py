@@ -2,16 +2,15 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Tuple
 
+import numpy as np
 import pandas as pd
 
 from backend.analytics import (
-    compute_adf,
     compute_hedge_ratio,
-    compute_rolling_correlation,
-    compute_spread,
-    compute_zscore,
+    compute_pair_analytics,
     resample_ohlcv,
     ticks_to_dataframe,
 )
@@ -19,10 +18,59 @@ from backend.schemas import ADFPayload, AnalyticsResponse, HedgeRatioResponse
 
 
 def _price_series(ticks) -> pd.Series:
-    df = ticks_to_dataframe(ticks)
-    if df.empty:
+    # A full OHLC-shaped DataFrame via ticks_to_dataframe is overkill for
+    # the one float column we need; build the array and index directly.
+    n = len(ticks)
+    if n == 0:
+        return pd.Series(dtype="float64")
+    if isinstance(ticks[0], dict):
+        prices = np.fromiter((tick["price"] for tick in ticks), dtype=np.float64, count=n)
+        timestamps = [tick["ts"] for tick in ticks]
+    else:
+        prices = np.fromiter((tick.price for tick in ticks), dtype=np.float64, count=n)
+        timestamps = [tick.ts for tick in ticks]
+    index = pd.DatetimeIndex(pd.to_datetime(timestamps, utc=True), name="ts")
+    series = pd.Series(prices, index=index)
+    if not index.is_monotonic_increasing:
+        series = series.sort_index()
+    return series
+
+
+def price_series_from_arrays(ts_ns: np.ndarray, price: np.ndarray) -> pd.Series:
+    """Build a UTC-indexed price series straight from buffer columns.
+
+    Consumers holding TickBuffer.snapshot_arrays() output use this instead
+    of materializing a list of Tick objects just to flatten it again.
+    """
+
+    if ts_ns.size == 0:
         return pd.Series(dtype="float64")
-    return df["price"].astype(float)
+    index = pd.DatetimeIndex(ts_ns.view("datetime64[ns]"), name="ts").tz_localize("UTC")
+    return pd.Series(price, index=index)
+
+
+# Results keyed by buffer fingerprints (length + last timestamp per leg)
+# and the request parameters. Polls with no new ticks — the common case
+# between broadcast intervals — skip the entire pipeline. Same
+# self-invalidating scheme as the live stream's metrics memo.
+_PAIR_METRICS_CACHE: dict = {}
+_PAIR_METRICS_CACHE_MAX = 128
+
+# One worker is enough: the caller builds the second leg on its own thread
+# while the pool handles the first.
+_SERIES_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="price-series")
+
+
+def _tick_fingerprint(ticks) -> Tuple[object, int, object, object]:
+    # Symbol and last price are part of the key: length + timestamp alone
+    # collide across pairs once the ring buffers are full (len pinned at
+    # tick_buffer_size) and two symbols tick in the same millisecond.
+    if not ticks:
+        return (None, 0, None, None)
+    last = ticks[-1]
+    if isinstance(last, dict):
+        return (last["symbol"], len(ticks), last["ts"], last["price"])
+    return (last.symbol, len(ticks), last.ts, last.price)
 
 
 def compute_pair_metrics(
@@ -35,59 +83,105 @@ def compute_pair_metrics(
 ) -> Tuple[AnalyticsResponse, Dict[str, float]]:
     """Compute analytics payload and raw metric map for alerts."""
 
-    series_a = _price_series(ticks_a)
+    cache_key = (
+        _tick_fingerprint(ticks_a),
+        _tick_fingerprint(ticks_b),
+        window,
+        include_intercept,
+        adf,
+    )
+    cached = _PAIR_METRICS_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    # The two legs are independent; building them concurrently overlaps
+    # the timestamp conversion (which releases the GIL inside pandas) so
+    # long buffers pay roughly one series' construction time.
+    future_a = _SERIES_POOL.submit(_price_series, ticks_a)
     series_b = _price_series(ticks_b)
+    series_a = future_a.result()
+
+    result = compute_pair_metrics_from_series(
+        series_a,
+        series_b,
+        window=window,
+        include_intercept=include_intercept,
+        adf=adf,
+    )
+    if len(_PAIR_METRICS_CACHE) >= _PAIR_METRICS_CACHE_MAX:
+        _PAIR_METRICS_CACHE.pop(next(iter(_PAIR_METRICS_CACHE)))
+    _PAIR_METRICS_CACHE[cache_key] = result
+    return result
+
+
+# Built once: the zeroed response for empty inputs never varies, and
+# validating the nested Pydantic models on every empty poll is pure
+# overhead. Callers treat responses as read-only.
+_EMPTY_PAIR_RESULT: Tuple[AnalyticsResponse, Dict[str, float]] = (
+    AnalyticsResponse(
+        hedge_ratio=HedgeRatioResponse(
+            beta=0.0, intercept=0.0, rvalue=None, pvalue=None, stderr=None
+        ),
+        latest_spread=None,
+        latest_zscore=None,
+        rolling_correlation=None,
+        adf=None,
+    ),
+    {},
+)
+
+
+def _last_finite(series: pd.Series) -> float | None:
+    """Last finite value of a series, scanning backwards from the tail.
+
+    The invalid entries in spread/zscore/correlation cluster at the head
+    (warm-up windows), so the newest element is almost always valid and the
+    scan stops after one step — no isfinite mask or filtered copy over the
+    whole array.
+    """
+
+    values = series.to_numpy(dtype=np.float64, copy=False)
+    for i in range(values.size - 1, -1, -1):
+        value = values[i]
+        if np.isfinite(value):
+            return float(value)
+    return None
+
+
+def compute_pair_metrics_from_series(
+    series_a: pd.Series,
+    series_b: pd.Series,
+    *,
+    window: int,
+    include_intercept: bool,
+    adf: bool = False,
+) -> Tuple[AnalyticsResponse, Dict[str, float]]:
+    """Series-based core of compute_pair_metrics.
+
+    Callers that already hold price series (e.g. the analytics router after
+    resampling) use this directly instead of round-tripping through Tick
+    objects just to rebuild the same series here.
+    """
 
     if series_a.empty or series_b.empty:
-        return (
-            AnalyticsResponse(
-                hedge_ratio=HedgeRatioResponse(
-                    beta=0.0, intercept=0.0, rvalue=None, pvalue=None, stderr=None
-                ),
-                latest_spread=None,
-                latest_zscore=None,
-                rolling_correlation=None,
-                adf=None,
-            ),
-            {},
-        )
+        return _EMPTY_PAIR_RESULT
 
-    hedge = compute_hedge_ratio(series_a, series_b, include_intercept)
-    spread = compute_spread(series_a, series_b, hedge)
-    
-    # Ensure we have enough data for rolling calculations
-    effective_window = min(window, len(spread))
-    if effective_window < 2:
-        effective_window = 2
-    
-    zscore = compute_zscore(spread, effective_window) if len(spread) >= 2 else pd.Series(dtype="float64")
-    corr = compute_rolling_correlation(series_a, series_b, effective_window) if len(series_a) >= 2 and len(series_b) >= 2 else pd.Series(dtype="float64")
-
-    adf_payload = None
-    if adf and len(spread) >= 10:  # ADF needs sufficient data
-        try:
-            adf_payload = compute_adf(spread)
-        except (ValueError, Exception):  # pragma: no cover - defensive
-            pass
-
-    # Get latest non-null values
-    latest_spread = None
-    if not spread.empty:
-        valid_spread = spread.dropna()
-        if not valid_spread.empty:
-            latest_spread = float(valid_spread.iloc[-1])
-    
-    latest_zscore = None
-    if not zscore.empty:
-        valid_zscore = zscore.dropna()
-        if not valid_zscore.empty:
-            latest_zscore = float(valid_zscore.iloc[-1])
-    
-    latest_corr = None
-    if not corr.empty:
-        valid_corr = corr.dropna()
-        if not valid_corr.empty:
-            latest_corr = float(valid_corr.iloc[-1])
+    result = compute_pair_analytics(
+        series_a,
+        series_b,
+        window=window,
+        include_intercept=include_intercept,
+        include_adf=adf,
+    )
+    hedge = result["hedge_ratio"]
+    spread = result["spread"]
+    zscore = result["zscore"]
+    corr = result["correlation"]
+    adf_payload = result["adf"]
+
+    latest_spread = _last_finite(spread)
+    latest_zscore = _last_finite(zscore)
+    latest_corr = _last_finite(corr)
 
     analytics = AnalyticsResponse(
         hedge_ratio=HedgeRatioResponse(
@@ -119,8 +213,70 @@ def compute_pair_metrics(
     return analytics, {k: v for k, v in metrics_map.items() if v is not None}
 
 
+# Hedge regressions keyed by series fingerprints. The regression is O(N)
+# over the aligned pair and its result is invariant while neither leg has
+# a new tick, so repeat polls reuse the previous fit.
+_HEDGE_CACHE: dict = {}
+_HEDGE_CACHE_MAX = 128
+
+
+def _series_fingerprint(series: pd.Series) -> Tuple[int, object, float]:
+    return (len(series), series.index[-1], float(series.iloc[-1]))
+
+
+def compute_pair_hedge_only(
+    series_a: pd.Series,
+    series_b: pd.Series,
+    *,
+    include_intercept: bool,
+) -> HedgeRatioResponse:
+    """Compute just the hedge ratio, skipping spread/z-score/correlation.
+
+    The /hedge-ratio endpoint only needs the regression output, so running
+    the full pair pipeline and discarding everything else is wasted work.
+    """
+
+    if series_a.empty or series_b.empty:
+        return HedgeRatioResponse(
+            beta=0.0, intercept=0.0, rvalue=None, pvalue=None, stderr=None
+        )
+
+    cache_key = (
+        _series_fingerprint(series_a),
+        _series_fingerprint(series_b),
+        include_intercept,
+    )
+    cached = _HEDGE_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    hedge = compute_hedge_ratio(series_a, series_b, include_intercept)
+    response = HedgeRatioResponse(
+        beta=hedge.beta,
+        intercept=hedge.intercept,
+        rvalue=hedge.rvalue,
+        pvalue=hedge.pvalue,
+        stderr=hedge.stderr,
+    )
+    if len(_HEDGE_CACHE) >= _HEDGE_CACHE_MAX:
+        _HEDGE_CACHE.pop(next(iter(_HEDGE_CACHE)))
+    _HEDGE_CACHE[cache_key] = response
+    return response
+
+
 def resample_ticks(ticks, timeframe: str) -> pd.DataFrame:
     df = ticks_to_dataframe(ticks)
+    return resample_ticks_df(df, timeframe)
+
+
+def resample_ticks_df(df: pd.DataFrame, timeframe: str) -> pd.DataFrame:
+    """Resample an already-built tick frame (ts index, price/size columns).
+
+    Callers that hold a parsed DataFrame — e.g. the CSV upload endpoint —
+    use this directly instead of exploding rows into dicts for
+    ``resample_ticks`` to immediately rebuild the same frame.
+    """
+
     return resample_ohlcv(df, timeframe)
 
 
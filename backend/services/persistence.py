@@ -4,11 +4,14 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 
 from backend.core.config import settings
-from backend.schemas.tick import Tick
-from backend.storage import insert_ticks
+from backend.schemas.tick import RawTick
+from backend.storage import insert_ticks, insert_ticks_conn, open_connection
 
 LOGGER = logging.getLogger(__name__)
 
@@ -16,16 +19,33 @@ LOGGER = logging.getLogger(__name__)
 class TickPersistenceWorker:
     """Persist ticks from the ingest service into SQLite."""
 
-    def __init__(self, queue_maxsize: int = 5_000) -> None:
-        self.queue: asyncio.Queue[Tick] = asyncio.Queue(maxsize=queue_maxsize)
+    def __init__(self, queue_maxsize: Optional[int] = None) -> None:
+        if queue_maxsize is None:
+            queue_maxsize = settings.db_queue_maxsize
+        self.queue: asyncio.Queue[RawTick] = asyncio.Queue(maxsize=queue_maxsize)
         self._task: Optional[asyncio.Task] = None
         self._running = False
-        self._buffer: List[Tick] = []
+        self._buffer: List[RawTick] = []
+        # Dedicated writer connection held for the worker's lifetime so each
+        # flush skips connect/close syscalls and pragma re-application.
+        self._conn: Optional[sqlite3.Connection] = None
+        # Single-thread executor that owns all writes on that connection,
+        # keeping the executemany + commit + fsync off the event loop while
+        # staying thread-consistent for SQLite.
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Group-commit bookkeeping: flushes arriving within
+        # db_min_commit_interval_seconds of the last commit leave the
+        # transaction open and share its eventual fsync.
+        self._last_commit_ts = 0.0
 
     async def start(self) -> None:
         if self._running:
             return
         self._running = True
+        self._conn = open_connection()
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="tick-db"
+        )
         self._task = asyncio.create_task(self._run(), name="tick-persistence")
         LOGGER.info("Tick persistence worker started")
 
@@ -40,6 +60,12 @@ class TickPersistenceWorker:
             except asyncio.CancelledError:
                 pass
         await self._flush(force=True)
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
         LOGGER.info("Tick persistence worker stopped")
 
     async def _run(self) -> None:
@@ -50,11 +76,19 @@ class TickPersistenceWorker:
                 try:
                     tick = await asyncio.wait_for(self.queue.get(), timeout=flush_interval)
                     self._buffer.append(tick)
+                    # Drain whatever else arrived in the same burst so the
+                    # loop wakes once per batch instead of once per tick.
+                    while True:
+                        try:
+                            self._buffer.append(self.queue.get_nowait())
+                        except asyncio.QueueEmpty:
+                            break
                     if len(self._buffer) >= batch_size:
                         await self._flush()
                 except asyncio.TimeoutError:
-                    if self._buffer:
-                        await self._flush()
+                    # Also commits a transaction a prior group-commit flush
+                    # left open, even when no new ticks arrived.
+                    await self._flush(force=True)
         except asyncio.CancelledError:
             LOGGER.debug("Persistence worker cancelled")
         finally:
@@ -62,11 +96,27 @@ class TickPersistenceWorker:
                 await self._flush(force=True)
 
     async def _flush(self, force: bool = False) -> None:
-        if not self._buffer:
+        pending_txn = self._conn is not None and self._conn.in_transaction
+        if not self._buffer and not pending_txn:
             return
         batch = list(self._buffer)
         self._buffer.clear()
-        written = insert_ticks(batch)
+        if self._conn is not None and self._executor is not None:
+            now = time.monotonic()
+            commit = force or (
+                now - self._last_commit_ts
+                >= settings.db_min_commit_interval_seconds
+            )
+            # The write (and its fsync) runs on the executor thread so the
+            # event loop keeps serving ingest while the batch commits.
+            loop = asyncio.get_running_loop()
+            written = await loop.run_in_executor(
+                self._executor, insert_ticks_conn, self._conn, batch, commit
+            )
+            if commit:
+                self._last_commit_ts = now
+        else:
+            written = insert_ticks(batch)
         LOGGER.debug("Flushed %s ticks to SQLite (force=%s)", written, force)
 
 
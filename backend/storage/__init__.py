@@ -1,17 +1,23 @@
 """Storage layer interfaces."""
 
 from .sqlite import (
+    bulk_insert_ticks,
     fetch_recent_ticks,
     get_connection,
     init_db,
     insert_ticks,
+    insert_ticks_conn,
+    open_connection,
 )
 
 __all__ = [
+    "bulk_insert_ticks",
     "fetch_recent_ticks",
     "get_connection",
     "init_db",
     "insert_ticks",
+    "insert_ticks_conn",
+    "open_connection",
 ]
 
 
@@ -4,15 +4,26 @@ from __future__ import annotations
 
 import sqlite3
 from contextlib import contextmanager
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, Iterator
 
 from backend.core.config import settings
-from backend.schemas.tick import Tick
+from backend.schemas.tick import RawTick, Tick
 
+# Bind datetimes as integer unix-nanoseconds, matching the ticks.ts column.
+# This also replaces the stdlib's default ISO-text datetime adapter, which
+# is deprecated since Python 3.12.
+sqlite3.register_adapter(datetime, lambda dt: int(dt.timestamp() * 1e9))
 
+
+@lru_cache(maxsize=1)
 def _db_path() -> Path:
+    # Cached: resolving the path runs two mkdir syscalls, and the result
+    # never changes for the process lifetime (settings are frozen at
+    # startup). Tests that repoint settings.data_dir mid-process must call
+    # _db_path.cache_clear().
     path = Path(settings.sqlite_path)
     if not path.is_absolute():
         data_dir = Path(settings.data_dir)
@@ -22,70 +33,212 @@ def _db_path() -> Path:
     return path
 
 
+# Applied to every connection. WAL turns the per-commit rollback-journal
+# fsync into a sequential log append and lets readers run alongside the
+# writer; synchronous=NORMAL is safe under WAL (a crash can lose the last
+# commit, never corrupt the file). The negative cache_size is KiB of page
+# cache; mmap_size lets reads go through the page cache without a copy.
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+def _apply_pragmas(connection: sqlite3.Connection) -> None:
+    for pragma in _PRAGMAS:
+        connection.execute(pragma)
+
+
 @contextmanager
 def get_connection() -> Iterator[sqlite3.Connection]:
-    connection = sqlite3.connect(_db_path())
+    # isolation_level=None disables sqlite3's implicit-transaction
+    # machinery; writes manage their own BEGIN IMMEDIATE .. COMMIT so a
+    # batch is never silently split or double-committed.
+    connection = sqlite3.connect(_db_path(), isolation_level=None)
+    _apply_pragmas(connection)
     try:
         yield connection
     finally:
         connection.close()
 
 
+def open_connection() -> sqlite3.Connection:
+    """Open a long-lived connection with the standard pragmas applied.
+
+    For callers that keep one connection for many operations (the
+    persistence worker); the caller owns closing it. check_same_thread is
+    disabled so the owner may hand the connection to a worker thread.
+    """
+
+    connection = sqlite3.connect(
+        _db_path(), isolation_level=None, check_same_thread=False
+    )
+    _apply_pragmas(connection)
+    return connection
+
+
 def init_db() -> None:
     """Initialise database tables if they do not exist."""
 
     with get_connection() as conn:
+        # ts moved from ISO-8601 TEXT to INTEGER nanoseconds. The ticks
+        # table is a re-fillable cache, so a database created with the old
+        # schema is dropped and recreated rather than migrated — leaving
+        # TEXT rows in place would break every fetch on the upgraded file.
+        ts_type = next(
+            (
+                row[2]
+                for row in conn.execute("PRAGMA table_info(ticks)")
+                if row[1] == "ts"
+            ),
+            None,
+        )
+        if ts_type is not None and ts_type.upper() != "INTEGER":
+            conn.execute("DROP TABLE ticks")
         conn.execute(
             """
             CREATE TABLE IF NOT EXISTS ticks (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
-                ts TEXT NOT NULL,
+                ts INTEGER NOT NULL,
                 symbol TEXT NOT NULL,
                 price REAL NOT NULL,
                 size REAL NOT NULL
             )
             """
         )
-        conn.commit()
+        # fetch_recent_ticks runs WHERE symbol=? ORDER BY ts DESC LIMIT ?;
+        # this index turns that from a full scan + sort into a backward
+        # range scan that stops at the limit.
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_ticks_symbol_ts ON ticks(symbol, ts DESC)"
+        )
 
 
-def insert_ticks(ticks: Iterable[Tick]) -> int:
-    """Bulk insert ticks into the database."""
+def _iter_tick_rows(ticks: Iterable[Tick | RawTick]) -> Iterator[tuple]:
+    # Timestamps are stored as integer unix-nanoseconds: RawTick carries
+    # them natively, so the hot path binds an int with no datetime work at
+    # all; Pydantic Ticks go through the registered datetime adapter.
+    # A generator: executemany consumes rows lazily, so no parameter list
+    # is ever materialized alongside the tick batch.
+    for tick in ticks:
+        yield (
+            tick.ts_ns if isinstance(tick, RawTick) else tick.ts,
+            tick.symbol,
+            tick.price,
+            tick.size,
+        )
 
-    rows = [
-        (tick.ts.isoformat(), tick.symbol, tick.price, tick.size)
-        for tick in ticks
-    ]
-    if not rows:
+
+def insert_ticks_conn(
+    conn: sqlite3.Connection,
+    ticks: Iterable[Tick | RawTick],
+    commit: bool = True,
+) -> int:
+    """Bulk insert ticks on a caller-owned connection.
+
+    Used by the persistence worker with its long-lived writer connection so
+    each flush skips connect/close and pragma setup. With ``commit=True``
+    the explicit BEGIN IMMEDIATE .. COMMIT costs exactly one fsync per
+    batch; ``commit=False`` leaves the transaction open so the worker can
+    group-commit several burst flushes under a single fsync (a later call
+    with ``commit=True`` — possibly with no new ticks — closes it).
+    """
+
+    ticks = ticks if isinstance(ticks, (list, tuple)) else list(ticks)
+    if not ticks:
+        if commit and conn.in_transaction:
+            conn.execute("COMMIT")
         return 0
 
-    with get_connection() as conn:
+    if not conn.in_transaction:
+        conn.execute("BEGIN IMMEDIATE")
+    try:
         conn.executemany(
-            "INSERT INTO ticks (ts, symbol, price, size) VALUES (?, ?, ?, ?)", rows
+            "INSERT INTO ticks (ts, symbol, price, size) VALUES (?, ?, ?, ?)",
+            _iter_tick_rows(ticks),
         )
-        conn.commit()
-        return len(rows)
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    if commit:
+        conn.execute("COMMIT")
+    return len(ticks)
+
+
+def insert_ticks(ticks: Iterable[Tick | RawTick]) -> int:
+    """Bulk insert ticks into the database.
+
+    Accepts the hot-path ``RawTick`` (int ns timestamps, stored as-is)
+    as well as the Pydantic ``Tick``.
+    """
+
+    with get_connection() as conn:
+        return insert_ticks_conn(conn, ticks)
+
+
+@contextmanager
+def _bulk_mode(conn: sqlite3.Connection) -> Iterator[None]:
+    """Drop journalling and sync guarantees for the duration of a backfill.
+
+    Backfill-only: a crash mid-import can corrupt the database, which is
+    acceptable when the import can simply be re-run from source. WAL and
+    NORMAL sync are restored on exit, success or not.
+    """
+
+    conn.execute("PRAGMA journal_mode=OFF")
+    conn.execute("PRAGMA synchronous=OFF")
+    try:
+        yield
+    finally:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+
+
+def bulk_insert_ticks(ticks: Iterable[Tick | RawTick]) -> int:
+    """One-off bulk import of ticks with durability traded for speed.
+
+    For initial backfills, not the live flush path — inserts run with the
+    journal and fsyncs disabled, then the standard pragmas are restored.
+    """
+
+    ticks = ticks if isinstance(ticks, (list, tuple)) else list(ticks)
+    if not ticks:
+        return 0
+
+    with get_connection() as conn:
+        with _bulk_mode(conn):
+            conn.executemany(
+                "INSERT INTO ticks (ts, symbol, price, size) VALUES (?, ?, ?, ?)",
+                _iter_tick_rows(ticks),
+            )
+        return len(ticks)
 
 
 def fetch_recent_ticks(symbol: str, limit: int = 1000) -> list[Tick]:
     """Retrieve recent ticks for a symbol."""
 
-    query = (
-        "SELECT ts, symbol, price, size FROM ticks WHERE symbol = ? ORDER BY ts DESC LIMIT ?"
-    )
+    # symbol is the query argument, so there is no need to read it back
+    # per row; construct() skips validation on values that came straight
+    # out of our own table, and reverse() flips oldest-first in place
+    # instead of allocating a second list.
+    query = "SELECT ts, price, size FROM ticks WHERE symbol = ? ORDER BY ts DESC LIMIT ?"
     with get_connection() as conn:
         rows = conn.execute(query, (symbol, limit)).fetchall()
 
     ticks = [
-        Tick(
-            ts=datetime.fromisoformat(ts),
+        Tick.construct(
+            ts=datetime.fromtimestamp(ts_ns / 1e9, tz=timezone.utc),
             symbol=symbol,
             price=price,
             size=size,
         )
-        for ts, symbol, price, size in rows
+        for ts_ns, price, size in rows
     ]
-    return list(reversed(ticks))
+    ticks.reverse()
+    return ticks
 
 
 